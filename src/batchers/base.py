@@ -227,6 +227,9 @@ class ContractBatcher(BaseBatcher):
 
         async def _call():
             call_data = self._prepare_call_data([addresses])
-            return self._make_batch_call(call_data, block_identifier)
+            # eth.call blocks; run it off the event loop so batches can overlap
+            return await asyncio.to_thread(
+                self._make_batch_call, call_data, block_identifier
+            )
 
         return await self._retry_operation(_call)
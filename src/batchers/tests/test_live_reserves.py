@@ -80,8 +80,8 @@ class TestLiveReserves:
             assert "reserve0" in data, "Missing reserve0"
             assert "reserve1" in data, "Missing reserve1"
 
-            reserve0 = int(data["reserve0"], 16)
-            reserve1 = int(data["reserve1"], 16)
+            reserve0 = data["reserve0"]
+            reserve1 = data["reserve1"]
 
             assert reserve0 >= 0, "Invalid reserve0"
             assert reserve1 >= 0, "Invalid reserve1"
@@ -111,8 +111,8 @@ class TestLiveReserves:
             assert "reserve0" in data, f"Missing reserve0 for pair {pair}"
             assert "reserve1" in data, f"Missing reserve1 for pair {pair}"
 
-            reserve0 = int(data["reserve0"], 16)
-            reserve1 = int(data["reserve1"], 16)
+            reserve0 = data["reserve0"]
+            reserve1 = data["reserve1"]
 
             assert reserve0 >= 0, f"Invalid reserve0 for pair {pair}"
             assert reserve1 >= 0, f"Invalid reserve1 for pair {pair}"
@@ -142,15 +142,15 @@ class TestLiveReserves:
             assert "reserve0" in data, f"Missing reserve0 for pair {pair}"
             assert "reserve1" in data, f"Missing reserve1 for pair {pair}"
 
-            reserve0 = int(data["reserve0"], 16)
-            reserve1 = int(data["reserve1"], 16)
+            reserve0 = data["reserve0"]
+            reserve1 = data["reserve1"]
 
             assert reserve0 >= 0, f"Invalid reserve0 for pair {pair}"
             assert reserve1 >= 0, f"Invalid reserve1 for pair {pair}"
 
         # Calculate totals for logging
-        total_reserve0 = sum(int(data["reserve0"], 16) for data in reserves.values())
-        total_reserve1 = sum(int(data["reserve1"], 16) for data in reserves.values())
+        total_reserve0 = sum(data["reserve0"] for data in reserves.values())
+        total_reserve1 = sum(data["reserve1"] for data in reserves.values())
 
         logger.info(
             f"✅ Chunked fetch: {len(reserves)} pairs in {expected_chunks} chunks"
@@ -175,8 +175,8 @@ class TestLiveReserves:
             assert "reserve0" in data, f"Missing reserve0 for pair {pair}"
             assert "reserve1" in data, f"Missing reserve1 for pair {pair}"
 
-            reserve0 = int(data["reserve0"], 16)
-            reserve1 = int(data["reserve1"], 16)
+            reserve0 = data["reserve0"]
+            reserve1 = data["reserve1"]
 
             assert reserve0 >= 0, f"Invalid reserve0 for pair {pair}"
             assert reserve1 >= 0, f"Invalid reserve1 for pair {pair}"
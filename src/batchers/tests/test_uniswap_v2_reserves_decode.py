@@ -0,0 +1,112 @@
+"""
+Offline tests for UniswapV2ReservesBatcher response decoding.
+
+Payloads are built by hand so the packed-slot byte offsets and big-endian
+decoding are checked without an RPC connection.
+"""
+
+import logging
+
+import pytest
+from eth_abi import encode
+
+from ..base import BatchError
+from ..uniswap_v2_reserves import UniswapV2ReservesBatcher
+
+PAIRS = [
+    "0xA478c2975Ab1Ea89e8196811F51A7B7Ade33eB11",
+    "0xB4e16d0168e52d35CaCD2c6185b44281Ec28C9Dc",
+]
+
+
+def _batcher(chain_id: int) -> UniswapV2ReservesBatcher:
+    """Build a batcher for decoding only (no web3, no contract bytecode)."""
+    batcher = UniswapV2ReservesBatcher.__new__(UniswapV2ReservesBatcher)
+    batcher.chain_id = chain_id
+    batcher.logger = logging.getLogger(__name__)
+    return batcher
+
+
+def _packed_slot(reserve0: int, reserve1: int, timestamp: int) -> bytes:
+    """uint112 reserve0 | uint112 reserve1 | uint32 blockTimestampLast."""
+    return (
+        reserve0.to_bytes(14, "big")
+        + reserve1.to_bytes(14, "big")
+        + timestamp.to_bytes(4, "big")
+    )
+
+
+class TestDecodeEthereumReserves:
+    """Packed getReserves slots returned on Ethereum mainnet."""
+
+    def test_slot_offsets_and_byte_order(self):
+        """reserve0 is bytes 0-13, reserve1 bytes 14-27, timestamp bytes 28-31."""
+        reserve0 = int.from_bytes(bytes(range(1, 15)), "big")  # 0x0102...0e
+        reserve1 = 2**112 - 1  # every byte of its field set
+        timestamp = 0x01020304
+        slot = _packed_slot(reserve0, reserve1, timestamp)
+        assert slot[:14] == bytes(range(1, 15))
+        assert slot[14:28] == b"\xff" * 14
+        assert slot[28:] == b"\x01\x02\x03\x04"
+
+        raw = encode(
+            ["uint256", "bytes32[]"],
+            [19_000_000, [slot, _packed_slot(1, 256, 0)]],
+        )
+
+        decoded = _batcher(1)._decode_reserves_response(raw, PAIRS)
+
+        assert decoded == {
+            PAIRS[0].lower(): {
+                "reserve0": reserve0,
+                "reserve1": reserve1,
+                "block_timestamp_last": timestamp,
+            },
+            PAIRS[1].lower(): {
+                "reserve0": 1,
+                "reserve1": 256,
+                "block_timestamp_last": 0,
+            },
+        }
+
+    def test_missing_slots_are_skipped(self):
+        """Pairs beyond the returned slots are left out rather than zeroed."""
+        raw = encode(["uint256", "bytes32[]"], [1, [_packed_slot(5, 7, 9)]])
+
+        decoded = _batcher(1)._decode_reserves_response(raw, PAIRS)
+
+        assert list(decoded) == [PAIRS[0].lower()]
+
+    def test_malformed_response_raises_batch_error(self):
+        """A truncated payload surfaces as BatchError."""
+        with pytest.raises(BatchError):
+            _batcher(1)._decode_reserves_response(b"\x00" * 16, PAIRS)
+
+
+class TestDecodeBaseReserves:
+    """Base returns each reserve in its own 32-byte word."""
+
+    def test_full_width_words(self):
+        """Each reserve is decoded from a whole big-endian word."""
+        reserve0 = 2**112 + 1  # wider than a packed uint112 field
+        reserve1 = 0x0102030405060708
+        raw = encode(
+            ["uint256", "bytes32[2][]"],
+            [
+                1,
+                [
+                    [reserve0.to_bytes(32, "big"), reserve1.to_bytes(32, "big")],
+                    [(0).to_bytes(32, "big"), (1).to_bytes(32, "big")],
+                ],
+            ],
+        )
+
+        decoded = _batcher(8453)._decode_reserves_response(raw, PAIRS)
+
+        assert decoded[PAIRS[0].lower()] == {
+            "reserve0": reserve0,
+            "reserve1": reserve1,
+            "block_timestamp_last": 0,
+        }
+        assert decoded[PAIRS[1].lower()]["reserve0"] == 0
+        assert decoded[PAIRS[1].lower()]["reserve1"] == 1
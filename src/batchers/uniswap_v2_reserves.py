@@ -5,10 +5,11 @@ This module provides efficient batch fetching of Uniswap V2 pair reserves
 using a pre-compiled Solidity contract via eth.call().
 """
 
+import asyncio
 import json
 import os
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Union
+from typing import AsyncIterator, Dict, List, Optional, Union
 
 from eth_abi import decode
 from web3 import Web3
@@ -123,7 +124,7 @@ class UniswapV2ReservesBatcher(ContractBatcher):
 
     def _decode_reserves_response(
         self, raw_response: bytes, pair_addresses: List[str]
-    ) -> Dict[str, Dict[str, str]]:
+    ) -> Dict[str, Dict[str, int]]:
         """
         Decode the raw response from the reserves batch call.
 
@@ -149,7 +150,7 @@ class UniswapV2ReservesBatcher(ContractBatcher):
 
     def _decode_ethereum_reserves(
         self, raw_response: bytes, pair_addresses: List[str]
-    ) -> Dict[str, Dict[str, str]]:
+    ) -> Dict[str, Dict[str, int]]:
         """
         Decode reserves response for Ethereum mainnet format.
 
@@ -165,20 +166,19 @@ class UniswapV2ReservesBatcher(ContractBatcher):
         decoded_reserves = {}
         for i, pair_address in enumerate(pair_addresses):
             if i < len(reserves_data):
-                reserve_bytes = reserves_data[i].hex()
+                # Packed slot: uint112 reserve0 | uint112 reserve1 | uint32 timestamp
+                reserve_bytes = reserves_data[i]
                 decoded_reserves[pair_address.lower()] = {
-                    "reserve0": reserve_bytes[0:28],
-                    "reserve1": reserve_bytes[28:56],
-                    "block_timestamp_last": int(reserve_bytes[56:64], 16)
-                    if len(reserve_bytes) > 56
-                    else 0,
+                    "reserve0": int.from_bytes(reserve_bytes[0:14], "big"),
+                    "reserve1": int.from_bytes(reserve_bytes[14:28], "big"),
+                    "block_timestamp_last": int.from_bytes(reserve_bytes[28:32], "big"),
                 }
 
         return decoded_reserves
 
     def _decode_base_reserves(
         self, raw_response: bytes, pair_addresses: List[str]
-    ) -> Dict[str, Dict[str, str]]:
+    ) -> Dict[str, Dict[str, int]]:
         """
         Decode reserves response for Base chain format.
 
@@ -195,8 +195,8 @@ class UniswapV2ReservesBatcher(ContractBatcher):
         for i, pair_address in enumerate(pair_addresses):
             if i < len(reserves_data):
                 decoded_reserves[pair_address.lower()] = {
-                    "reserve0": reserves_data[i][0].hex(),
-                    "reserve1": reserves_data[i][1].hex(),
+                    "reserve0": int.from_bytes(reserves_data[i][0], "big"),
+                    "reserve1": int.from_bytes(reserves_data[i][1], "big"),
                     "block_timestamp_last": 0,  # Base format doesn't include timestamp
                 }
 
@@ -204,7 +204,7 @@ class UniswapV2ReservesBatcher(ContractBatcher):
 
     async def fetch_reserves_chunked(
         self, pair_addresses: List[str], block_identifier: Union[int, str] = "latest"
-    ) -> Dict[str, Dict[str, str]]:
+    ) -> Dict[str, Dict[str, int]]:
         """
         Fetch reserves for a large number of pairs using chunking.
 
@@ -216,26 +216,61 @@ class UniswapV2ReservesBatcher(ContractBatcher):
             Combined reserves data from all chunks
         """
         all_reserves = {}
+        async for chunk_reserves in self.iter_reserves_chunked(
+            pair_addresses, block_identifier
+        ):
+            all_reserves.update(chunk_reserves)
+
+        return all_reserves
+
+    async def iter_reserves_chunked(
+        self, pair_addresses: List[str], block_identifier: Union[int, str] = "latest"
+    ) -> AsyncIterator[Dict[str, Dict[str, int]]]:
+        """
+        Fetch reserves chunk by chunk, yielding each chunk as it arrives.
+
+        The next chunk's call is started before the current one is yielded,
+        so callers can process reserves while the following RPC is in flight.
+
+        Args:
+            pair_addresses: List of pair addresses (can be large)
+            block_identifier: Block to call at
+
+        Yields:
+            Reserves data for one chunk
+        """
         chunks = self._chunk_addresses(pair_addresses)
 
         self.logger.info(
             f"Fetching reserves for {len(pair_addresses)} pairs in {len(chunks)} chunks"
         )
 
-        for i, chunk in enumerate(chunks):
-            self.logger.debug(
-                f"Processing chunk {i + 1}/{len(chunks)} with {len(chunk)} pairs"
-            )
+        pending = None
+        try:
+            for i, chunk in enumerate(chunks):
+                self.logger.debug(
+                    f"Processing chunk {i + 1}/{len(chunks)} with {len(chunk)} pairs"
+                )
 
-            result = await self.batch_call(chunk, block_identifier)
+                current = pending or asyncio.ensure_future(
+                    self.batch_call(chunk, block_identifier)
+                )
+                pending = None
+                if i + 1 < len(chunks):
+                    pending = asyncio.ensure_future(
+                        self.batch_call(chunks[i + 1], block_identifier)
+                    )
 
-            if result.success:
-                all_reserves.update(result.data)
-            else:
-                self.logger.warning(f"Chunk {i + 1} failed: {result.error}")
-                # Continue with other chunks rather than failing completely
+                result = await current
 
-        return all_reserves
+                if result.success:
+                    yield result.data
+                else:
+                    self.logger.warning(f"Chunk {i + 1} failed: {result.error}")
+                    # Continue with other chunks rather than failing completely
+        finally:
+            if pending is not None:
+                pending.cancel()
 
 
 # Convenience function for easy usage
@@ -244,7 +279,7 @@ async def fetch_uniswap_v2_reserves(
     pair_addresses: List[str],
     block_identifier: Union[int, str] = "latest",
     batch_size: int = 100,
-) -> Dict[str, Dict[str, str]]:
+) -> Dict[str, Dict[str, int]]:
     """
     Convenience function to fetch Uniswap V2 reserves.
 
@@ -5,6 +5,7 @@ This module provides efficient batch fetching of Uniswap V3 pool data
 using a pre-compiled Solidity contract via eth.call().
 """
 
+import asyncio
 import json
 import os
 from datetime import datetime, timezone
@@ -198,7 +199,10 @@ class UniswapV3DataBatcher(ContractBatcher):
 
         async def _call():
             call_data = self._prepare_call_data(pool_addresses)
-            return self._make_batch_call(call_data, block_identifier)
+            # eth.call blocks; run it off the event loop so batches can overlap
+            return await asyncio.to_thread(
+                self._make_batch_call, call_data, block_identifier
+            )
 
         return await self._retry_operation(_call)
 
@@ -5,6 +5,7 @@ This module provides efficient batch fetching of Uniswap V4 pool data
 using a pre-compiled Solidity contract via eth.call().
 """
 
+import asyncio
 import json
 import os
 from datetime import datetime, timezone
@@ -204,7 +205,10 @@ class UniswapV4DataBatcher(ContractBatcher):
 
         async def _call():
             call_data = self._prepare_call_data(pool_ids)
-            return self._make_batch_call(call_data, block_identifier)
+            # eth.call blocks; run it off the event loop so batches can overlap
+            return await asyncio.to_thread(
+                self._make_batch_call, call_data, block_identifier
+            )
 
         return await self._retry_operation(_call)
 
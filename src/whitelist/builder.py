@@ -6,26 +6,64 @@ Build token whitelist based on multiple criteria:
 """
 
 import asyncio
+import gzip
+import heapq
 import json
 import logging
-import sys
+import time
+from collections import defaultdict
 from pathlib import Path
-from typing import Dict, List, Set
+from types import MappingProxyType
+from typing import Dict, List, Set, Tuple
 
 import aiohttp
+import ujson
 
-logger = logging.getLogger(__name__)
+from src.config import ConfigManager
+from src.core.storage.postgres import PostgresStorage
+from src.fetchers.exchange_fetchers import HyperliquidFetcher
 
-# Add project root to path
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+logger = logging.getLogger(__name__)
 
 # Parent reference for the whitelist module
 WHITELIST_DIR = Path(__file__).parent
 
-from src.config import ConfigManager
-from src.core.storage.postgres import PostgresStorage
-from src.fetchers.exchange_fetchers import HyperliquidFetcher
+# Shared read-only default for dict lookups (never mutated)
+_EMPTY: Dict = {}
+
+# On-disk cache of perp-DEX symbol -> Ethereum address lookups
+SYMBOL_CACHE_PATH = Path("data/symbol_cache/ethereum_symbol_addresses.json")
+SYMBOL_CACHE_TTL = 86400  # seconds - mapped symbols rarely change
+UNMAPPED_SYMBOL_CACHE_TTL = 3600  # seconds - retry unmapped symbols hourly
+
+SYMBOL_ADDRESS_QUERY = """
+SELECT DISTINCT
+    t.symbol,
+    p.address,
+    p.token_id,
+    p.decimals
+FROM coingecko_token_platforms p
+JOIN coingecko_tokens t ON p.token_id = t.id
+WHERE p.platform = 'ethereum'
+AND UPPER(t.symbol) = ANY($1)
+AND p.address IS NOT NULL
+AND p.address != ''
+AND p.address != '0x'
+"""
+
+
+def _write_json(output_path: str | Path, data: Dict) -> None:
+    """
+    Write data to a JSON file (blocking - run via asyncio.to_thread).
+
+    Paths ending in ".gz" are written gzip-compressed.
+    """
+    if str(output_path).endswith(".gz"):
+        with gzip.open(output_path, "wt", compresslevel=3) as f:
+            ujson.dump(data, f, indent=2, escape_forward_slashes=False)
+    else:
+        with open(output_path, "w") as f:
+            ujson.dump(data, f, indent=2, escape_forward_slashes=False)
 
 
 class TokenWhitelistBuilder:
@@ -36,21 +74,25 @@ class TokenWhitelistBuilder:
         self.config = ConfigManager()
         self.storage = storage
         self.whitelist_tokens: Set[str] = set()
-        self.token_sources: Dict[str, List[str]] = {}  # token -> [sources]
+        self._sorted_tokens: List[str] = []  # sorted view of whitelist_tokens
+        # token -> [sources]
+        self.token_sources: defaultdict[str, List[str]] = defaultdict(list)
         self.token_info: Dict[str, Dict] = {}  # token -> {coingecko_id, symbol, etc}
         self.unmapped_hyperliquid: Dict[
             str, str
         ] = {}  # symbol -> name (not found in DB)
         self.unmapped_lighter: Dict[str, str] = {}  # symbol -> name (not found in DB)
+        # UPPER(symbol) -> {"ts": fetched_at, "rows": [{symbol, address, ...}]}
+        self.symbol_cache: Dict[str, Dict] = self._load_symbol_cache()
 
-    async def get_cross_chain_tokens(self) -> Set[str]:
+    async def get_cross_chain_tokens(self) -> Tuple[Set[str], Dict[str, Dict]]:
         """
         Get tokens that exist on 2+ chains (base, ethereum, arbitrum).
 
         Queries coingecko_token_platforms table to find tokens present on multiple chains.
 
         Returns:
-            Set of token addresses (lowercase) from Ethereum
+            Tuple of (token addresses (lowercase) from Ethereum, token metadata by address)
         """
         print("🔗 Finding cross-chain tokens from coingecko_token_platforms...")
 
@@ -110,6 +152,7 @@ class TokenWhitelistBuilder:
 
         # Extract Ethereum addresses for tokens on 2+ chains
         cross_chain_tokens = set()
+        token_info: Dict[str, Dict] = {}
         for token_id, data in token_data.items():
             chains = data["chains"]
             chain_count = data["chain_count"]
@@ -120,7 +163,7 @@ class TokenWhitelistBuilder:
             eth_address = chains.get("ethereum")
             if eth_address:
                 cross_chain_tokens.add(eth_address)
-                self.token_info[eth_address] = {
+                token_info[eth_address] = {
                     "coingecko_id": token_id,
                     "symbol": symbol,
                     "decimals": decimals,
@@ -132,14 +175,88 @@ class TokenWhitelistBuilder:
                 )
 
         logger.info(f"  Found {len(cross_chain_tokens)} cross-chain tokens")
-        return cross_chain_tokens
+        return cross_chain_tokens, token_info
+
+    def _load_symbol_cache(self) -> Dict[str, Dict]:
+        """Load cached symbol -> address lookups from disk."""
+        if SYMBOL_CACHE_PATH.exists():
+            try:
+                with open(SYMBOL_CACHE_PATH, "r") as f:
+                    return json.load(f)
+            except Exception as e:
+                logger.warning(f"Failed to load symbol cache: {e}")
+        return {}
+
+    def _save_symbol_cache(self):
+        """Save symbol -> address lookups to disk."""
+        try:
+            SYMBOL_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            with open(SYMBOL_CACHE_PATH, "w") as f:
+                json.dump(self.symbol_cache, f)
+        except Exception as e:
+            logger.warning(f"Failed to save symbol cache: {e}")
 
-    async def get_hyperliquid_tokens(self) -> Set[str]:
+    async def _lookup_symbol_addresses(self, search_symbols: Set[str]) -> List[Dict]:
+        """
+        Map upper-cased symbols to Ethereum addresses via coingecko_token_platforms.
+
+        Fresh entries from the on-disk cache are reused; only stale or unseen
+        symbols are queried. Symbols with no match are cached with a shorter TTL
+        so they are retried periodically. Every entry for a symbol comes from
+        the same query, so concurrent lookups can only differ in the fetch
+        time; the cache is written to disk once by build_whitelist().
+
+        Args:
+            search_symbols: Upper-cased symbols to resolve
+
+        Returns:
+            List of rows with symbol, address, token_id and decimals
+        """
+        now = time.time()
+        rows: List[Dict] = []
+        to_query = []
+
+        for symbol in search_symbols:
+            entry = self.symbol_cache.get(symbol)
+            if entry is not None:
+                ttl = SYMBOL_CACHE_TTL if entry["rows"] else UNMAPPED_SYMBOL_CACHE_TTL
+                if now - entry["ts"] < ttl:
+                    rows.extend(entry["rows"])
+                    continue
+            to_query.append(symbol)
+
+        logger.info(
+            f"  Symbol cache: {len(search_symbols) - len(to_query)} hits, "
+            f"{len(to_query)} to query"
+        )
+        if not to_query:
+            return rows
+
+        async with self.storage.pool.acquire() as conn:
+            results = await conn.fetch(SYMBOL_ADDRESS_QUERY, to_query)
+
+        fetched: Dict[str, List[Dict]] = {symbol: [] for symbol in to_query}
+        for row in results:
+            row_dict = {
+                "symbol": row["symbol"],
+                "address": row["address"],
+                "token_id": row["token_id"],
+                "decimals": row["decimals"],
+            }
+            fetched.setdefault(row["symbol"].upper(), []).append(row_dict)
+            rows.append(row_dict)
+
+        for symbol, symbol_rows in fetched.items():
+            self.symbol_cache[symbol] = {"ts": now, "rows": symbol_rows}
+
+        return rows
+
+    async def get_hyperliquid_tokens(self) -> Tuple[Set[str], Dict[str, Dict]]:
         """
         Get tokens from Hyperliquid perp DEX and map to Ethereum addresses.
 
         Returns:
-            Set of Ethereum token addresses
+            Tuple of (Ethereum token addresses, token metadata by address)
         """
         print("\n💱 Fetching Hyperliquid tokens...")
 
@@ -149,14 +266,16 @@ class TokenWhitelistBuilder:
 
             if not result.success:
                 logger.error(f"   Failed to fetch Hyperliquid markets: {result.error}")
-                return set()
+                return set(), {}
 
             tokens_data = result.metadata.get("tokens", [])
             hyperliquid_symbols = set()
+            base_by_symbol = {}  # upper-cased symbol -> original base
 
             for token in tokens_data:
                 base = token.base.upper()
                 hyperliquid_symbols.add(base)
+                base_by_symbol.setdefault(base, token.base)
 
             logger.info(f"  Found {len(hyperliquid_symbols)} symbols on Hyperliquid")
 
@@ -175,26 +294,10 @@ class TokenWhitelistBuilder:
                     search_symbols.add(base_symbol)
                     k_token_mapping[base_symbol] = symbol
 
-            symbols_tuple = tuple(search_symbols)
-            query = """
-            SELECT DISTINCT
-                t.symbol,
-                p.address,
-                p.token_id,
-                p.decimals
-            FROM coingecko_token_platforms p
-            JOIN coingecko_tokens t ON p.token_id = t.id
-            WHERE p.platform = 'ethereum'
-            AND UPPER(t.symbol) = ANY($1)
-            AND p.address IS NOT NULL
-            AND p.address != ''
-            AND p.address != '0x'
-            """
-
-            async with self.storage.pool.acquire() as conn:
-                results = await conn.fetch(query, symbols_tuple)
+            results = await self._lookup_symbol_addresses(search_symbols)
 
             hyperliquid_addresses = set()
+            token_info: Dict[str, Dict] = {}
             mapped_symbols = set()
 
             for row in results:
@@ -214,8 +317,8 @@ class TokenWhitelistBuilder:
                         f"  ✓ {k_symbol} (k-token) -> {symbol} -> {address[:10]}..."
                     )
 
-                if address not in self.token_info:
-                    self.token_info[address] = {
+                if address not in token_info:
+                    token_info[address] = {
                         "coingecko_id": token_id,
                         "symbol": symbol,
                         "decimals": decimals,
@@ -228,36 +331,32 @@ class TokenWhitelistBuilder:
             if unmapped:
                 # Store unmapped for manual mapping
                 for symbol in unmapped:
-                    token_data = next(
-                        (t for t in tokens_data if t.base.upper() == symbol), None
-                    )
-                    if token_data:
-                        self.unmapped_hyperliquid[symbol] = token_data.base
+                    self.unmapped_hyperliquid[symbol] = base_by_symbol[symbol]
 
                 print(
-                    f"\n   ⚠️  Unmapped symbols ({len(unmapped)}): {', '.join(sorted(list(unmapped))[:20])}{'...' if len(unmapped) > 20 else ''}"
+                    f"\n   ⚠️  Hyperliquid unmapped symbols ({len(unmapped)}): {', '.join(sorted(list(unmapped))[:20])}{'...' if len(unmapped) > 20 else ''}"
                 )
 
             print(
-                f"   Mapped {len(hyperliquid_addresses)} of {len(hyperliquid_symbols)} symbols"
+                f"   Hyperliquid: mapped {len(hyperliquid_addresses)} of {len(hyperliquid_symbols)} symbols"
             )
-            return hyperliquid_addresses
+            return hyperliquid_addresses, token_info
 
         except Exception as e:
             logger.error(f"   Error fetching Hyperliquid tokens: {e}")
             import traceback
 
             traceback.print_exc()
-            return set()
+            return set(), {}
 
-    async def get_lighter_tokens(self) -> Set[str]:
+    async def get_lighter_tokens(self) -> Tuple[Set[str], Dict[str, Dict]]:
         """
         Get tokens from Lighter perp DEX using their API and map to Ethereum addresses.
 
         API: https://apidocs.lighter.xyz/reference/funding-rates
 
         Returns:
-            Set of Ethereum token addresses
+            Tuple of (Ethereum token addresses, token metadata by address)
         """
         logger.info("⚡ Fetching Lighter tokens...")
 
@@ -273,7 +372,7 @@ class TokenWhitelistBuilder:
                         logger.error(
                             f"Failed to fetch from Lighter API: HTTP {response.status}"
                         )
-                        return set()
+                        return set(), {}
 
                     data = await response.json()
                     logger.info(f"✓ Successfully connected to Lighter API")
@@ -314,26 +413,10 @@ class TokenWhitelistBuilder:
                         search_symbols.add(base_symbol)
                         lot_token_mapping[base_symbol] = symbol
 
-                symbols_tuple = tuple(search_symbols)
-                query = """
-                SELECT DISTINCT
-                    t.symbol,
-                    p.address,
-                    p.token_id,
-                    p.decimals
-                FROM coingecko_token_platforms p
-                JOIN coingecko_tokens t ON p.token_id = t.id
-                WHERE p.platform = 'ethereum'
-                AND UPPER(t.symbol) = ANY($1)
-                AND p.address IS NOT NULL
-                AND p.address != ''
-                AND p.address != '0x'
-                """
-
-                async with self.storage.pool.acquire() as conn:
-                    results = await conn.fetch(query, symbols_tuple)
+                results = await self._lookup_symbol_addresses(search_symbols)
 
                 lighter_addresses = set()
+                token_info: Dict[str, Dict] = {}
                 mapped_symbols = set()
 
                 for row in results:
@@ -353,8 +436,8 @@ class TokenWhitelistBuilder:
                             f"  ✓ {lot_symbol} (lot-token) -> {symbol} -> {address[:10]}..."
                         )
 
-                    if address not in self.token_info:
-                        self.token_info[address] = {
+                    if address not in token_info:
+                        token_info[address] = {
                             "coingecko_id": token_id,
                             "symbol": symbol,
                             "decimals": decimals,
@@ -370,24 +453,26 @@ class TokenWhitelistBuilder:
                         self.unmapped_lighter[symbol] = symbol
 
                     print(
-                        f"\n   ⚠️  Unmapped symbols: {', '.join(sorted(list(unmapped))[:10])}{'...' if len(unmapped) > 10 else ''}"
+                        f"\n   ⚠️  Lighter unmapped symbols: {', '.join(sorted(list(unmapped))[:10])}{'...' if len(unmapped) > 10 else ''}"
                     )
 
                 print(
-                    f"   Mapped {len(lighter_addresses)} of {len(lighter_symbols)} symbols"
+                    f"   Lighter: mapped {len(lighter_addresses)} of {len(lighter_symbols)} symbols"
                 )
-                return lighter_addresses
+                return lighter_addresses, token_info
 
-            return set()
+            return set(), {}
 
         except Exception as e:
             logger.error(f"   Error fetching Lighter tokens: {e}")
             import traceback
 
             traceback.print_exc()
-            return set()
+            return set(), {}
 
-    async def get_top_transferred_tokens(self, top_n: int = 100) -> Set[str]:
+    async def get_top_transferred_tokens(
+        self, top_n: int = 100
+    ) -> Tuple[Set[str], Dict[str, Dict]]:
         """
         Get top N transferred tokens on Ethereum by ranking score.
 
@@ -399,7 +484,7 @@ class TokenWhitelistBuilder:
             top_n: Number of top tokens to return
 
         Returns:
-            Set of token addresses (lowercase)
+            Tuple of (token addresses (lowercase), token metadata by address)
         """
         print(f"\n📊 Getting top {top_n} transferred tokens from transfers service...")
 
@@ -436,6 +521,7 @@ class TokenWhitelistBuilder:
                 await conn.close()
 
             top_tokens = set()
+            token_info: Dict[str, Dict] = {}
             for row in results:
                 token_address = row["token_address"].lower()
                 transfer_count = int(row["transfer_count_24h"])
@@ -443,8 +529,8 @@ class TokenWhitelistBuilder:
                 top_tokens.add(token_address)
 
                 # Add to token_info if not already there
-                if token_address not in self.token_info:
-                    self.token_info[token_address] = {
+                if token_address not in token_info:
+                    token_info[token_address] = {
                         "transfer_count_24h": transfer_count,
                         "unique_senders_24h": int(row["unique_senders_24h"]),
                         "unique_receivers_24h": int(row["unique_receivers_24h"]),
@@ -458,7 +544,7 @@ class TokenWhitelistBuilder:
                 )
 
             logger.info(f"  Found {len(top_tokens)} top transferred tokens")
-            return top_tokens
+            return top_tokens, token_info
 
         except Exception as e:
             logger.warning(f"    Error fetching top transferred tokens: {e}")
@@ -471,7 +557,7 @@ class TokenWhitelistBuilder:
             import traceback
 
             traceback.print_exc()
-            return set()
+            return set(), {}
 
     async def _save_unmapped_tokens(self):
         """Save unmapped tokens to file for manual mapping."""
@@ -481,18 +567,15 @@ class TokenWhitelistBuilder:
         # Save Hyperliquid unmapped
         if self.unmapped_hyperliquid:
             hyperliquid_path = output_dir / "hyperliquid_unmapped.json"
-            with open(hyperliquid_path, "w") as f:
-                json.dump(
-                    {
-                        "count": len(self.unmapped_hyperliquid),
-                        "unmapped_symbols": sorted(
-                            list(self.unmapped_hyperliquid.keys())
-                        ),
-                        "details": self.unmapped_hyperliquid,
-                    },
-                    f,
-                    indent=2,
-                )
+            await asyncio.to_thread(
+                _write_json,
+                hyperliquid_path,
+                {
+                    "count": len(self.unmapped_hyperliquid),
+                    "unmapped_symbols": sorted(self.unmapped_hyperliquid.keys()),
+                    "details": self.unmapped_hyperliquid,
+                },
+            )
             logger.info(
                 f"💾 Saved {len(self.unmapped_hyperliquid)} unmapped Hyperliquid tokens to {hyperliquid_path}"
             )
@@ -500,16 +583,15 @@ class TokenWhitelistBuilder:
         # Save Lighter unmapped
         if self.unmapped_lighter:
             lighter_path = output_dir / "lighter_unmapped.json"
-            with open(lighter_path, "w") as f:
-                json.dump(
-                    {
-                        "count": len(self.unmapped_lighter),
-                        "unmapped_symbols": sorted(list(self.unmapped_lighter.keys())),
-                        "details": self.unmapped_lighter,
-                    },
-                    f,
-                    indent=2,
-                )
+            await asyncio.to_thread(
+                _write_json,
+                lighter_path,
+                {
+                    "count": len(self.unmapped_lighter),
+                    "unmapped_symbols": sorted(self.unmapped_lighter.keys()),
+                    "details": self.unmapped_lighter,
+                },
+            )
             logger.info(
                 f"💾 Saved {len(self.unmapped_lighter)} unmapped Lighter tokens to {lighter_path}"
             )
@@ -555,6 +637,9 @@ class TokenWhitelistBuilder:
                 "v4_pairs": {},
             }
 
+        # Hoist membership checks onto a frozenset for the per-row filter
+        wl = frozenset(whitelist_tokens)
+
         # Get protocols for this chain
         protocols = ["uniswap_v2", "uniswap_v3", "uniswap_v4"]
 
@@ -579,7 +664,25 @@ class TokenWhitelistBuilder:
         dex_pools_table = f"network_{chain_id}__dex_pools"
         dex_pools_cryo_table = f"network_{chain_id}_dex_pools_cryo"
 
+        # Pairs bucketed by version as they are ingested
+        pairs_by_version = {"V2": {}, "V3": {}, "V4": {}}
+
         for protocol in protocols:
+            # Determine exchange name and version once per protocol
+            protocol_lower = protocol.lower().replace("_", "")
+            if "uniswap" in protocol_lower:
+                if "v2" in protocol_lower:
+                    exchange = "uniswapV2"
+                elif "v3" in protocol_lower:
+                    exchange = "uniswapV3"
+                elif "v4" in protocol_lower:
+                    exchange = "uniswapV4"
+                else:
+                    exchange = protocol
+            else:
+                exchange = protocol
+            version_bucket = pairs_by_version.get(exchange[-2:])
+
             try:
                 factories = self.config.protocols.get_factory_addresses(protocol, chain)
 
@@ -634,10 +737,7 @@ class TokenWhitelistBuilder:
                                 token1_addr = row["token1_address"].lower()
 
                                 # Only include pairs where BOTH tokens are in whitelist
-                                if (
-                                    token0_addr not in whitelist_tokens
-                                    or token1_addr not in whitelist_tokens
-                                ):
+                                if token0_addr not in wl or token1_addr not in wl:
                                     continue
 
                                 # Skip if we already have this pool
@@ -667,20 +767,6 @@ class TokenWhitelistBuilder:
                                     token0, token1 = token1, token0
                                     token0_addr, token1_addr = token1_addr, token0_addr
 
-                                # Determine exchange name
-                                protocol_lower = protocol.lower().replace("_", "")
-                                if "uniswap" in protocol_lower:
-                                    if "v2" in protocol_lower:
-                                        exchange = "uniswapV2"
-                                    elif "v3" in protocol_lower:
-                                        exchange = "uniswapV3"
-                                    elif "v4" in protocol_lower:
-                                        exchange = "uniswapV4"
-                                    else:
-                                        exchange = protocol
-                                else:
-                                    exchange = protocol
-
                                 # Parse additional_data and extract stable flag
                                 stable = None
                                 if row["additional_data"]:
@@ -710,6 +796,8 @@ class TokenWhitelistBuilder:
 
                                 # Add to dictionaries
                                 all_pairs[pool_addr] = pair_data
+                                if version_bucket is not None:
+                                    version_bucket[pool_addr] = pair_data
                                 all_tokens[token0_addr] = token0
                                 all_tokens[token1_addr] = token1
 
@@ -729,16 +817,10 @@ class TokenWhitelistBuilder:
         decimals = {addr: token["decimals"] for addr, token in all_tokens.items()}
         symbols = {addr: token["symbol"] for addr, token in all_tokens.items()}
 
-        # Filter by protocol
-        v2_pairs = {
-            addr: pair for addr, pair in all_pairs.items() if "V2" in pair["exchange"]
-        }
-        v3_pairs = {
-            addr: pair for addr, pair in all_pairs.items() if "V3" in pair["exchange"]
-        }
-        v4_pairs = {
-            addr: pair for addr, pair in all_pairs.items() if "V4" in pair["exchange"]
-        }
+        # Filter by protocol (classified once at ingestion)
+        v2_pairs = pairs_by_version["V2"]
+        v3_pairs = pairs_by_version["V3"]
+        v4_pairs = pairs_by_version["V4"]
 
         logger.info(f"  V2 pairs: {len(v2_pairs)}")
         logger.info(f"  V3 pairs: {len(v3_pairs)}")
@@ -767,8 +849,8 @@ class TokenWhitelistBuilder:
             Dictionary with:
             - total_tokens: Count of whitelisted tokens
             - tokens: List of whitelisted token addresses (sorted)
-            - token_sources: Dict mapping each token to its sources
-            - token_info: Dict with metadata for each token
+            - token_sources: Read-only mapping of each token to its sources
+            - token_info: Read-only mapping with metadata for each token
             - breakdown: Count by source (cross_chain, hyperliquid, lighter, top_transferred)
             - unmapped_hyperliquid: Symbols that couldn't be mapped to Ethereum addresses
             - unmapped_lighter: Symbols that couldn't be mapped to Ethereum addresses
@@ -777,95 +859,119 @@ class TokenWhitelistBuilder:
         print("🏗️  Building Token Whitelist")
         logger.info("=" * 70)
 
-        # Criterion 1: Cross-chain tokens
-        cross_chain = await self.get_cross_chain_tokens()
-        for token in cross_chain:
-            if token not in self.token_sources:
-                self.token_sources[token] = []
-            self.token_sources[token].append("cross_chain")
-
-        # Criterion 2: Hyperliquid tokens
-        hyperliquid_addresses = await self.get_hyperliquid_tokens()
-        for token in hyperliquid_addresses:
-            if token not in self.token_sources:
-                self.token_sources[token] = []
-            self.token_sources[token].append("hyperliquid")
-
-        # Criterion 3: Lighter tokens
-        lighter_addresses = await self.get_lighter_tokens()
-        for token in lighter_addresses:
-            if token not in self.token_sources:
-                self.token_sources[token] = []
-            self.token_sources[token].append("lighter")
-
-        # Criterion 4: Top transferred tokens
-        top_transferred = await self.get_top_transferred_tokens(top_transfers)
-        for token in top_transferred:
-            if token not in self.token_sources:
-                self.token_sources[token] = []
-            self.token_sources[token].append("top_transferred")
+        # Fetch all four criteria concurrently - each is an independent HTTP/DB call
+        (
+            (cross_chain, cross_chain_info),
+            (hyperliquid_addresses, hyperliquid_info),
+            (lighter_addresses, lighter_info),
+            (top_transferred, top_transferred_info),
+        ) = await asyncio.gather(
+            self.get_cross_chain_tokens(),
+            self.get_hyperliquid_tokens(),
+            self.get_lighter_tokens(),
+            self.get_top_transferred_tokens(top_transfers),
+        )
+        self._save_symbol_cache()
+
+        # Merge metadata in criterion order, independent of which fetcher
+        # finished first: cross-chain metadata always wins, then the first
+        # of Hyperliquid, Lighter and top-transferred to report a token
+        self.token_info.update(cross_chain_info)
+        for source_info in (hyperliquid_info, lighter_info, top_transferred_info):
+            for address, info in source_info.items():
+                self.token_info.setdefault(address, info)
+
+        # Tag each token with its sources, in criterion order
+        for tokens, tag in (
+            (cross_chain, "cross_chain"),
+            (hyperliquid_addresses, "hyperliquid"),
+            (lighter_addresses, "lighter"),
+            (top_transferred, "top_transferred"),
+        ):
+            for token in tokens:
+                self.token_sources[token].append(tag)
 
         # Combine all tokens
         self.whitelist_tokens = set(self.token_sources.keys())
+        self._sorted_tokens = sorted(self.whitelist_tokens)
 
-        # Print summary
-        print("\n" + "=" * 70)
-        print("📈 Whitelist Summary")
-        logger.info("=" * 70)
-        logger.info(f"Total whitelisted tokens: {len(self.whitelist_tokens)}")
-        print(f"\nBy source:")
-        logger.info(f"  Cross-chain: {len(cross_chain)}")
-        logger.info(f"  Hyperliquid: {len(hyperliquid_addresses)}")
-        logger.info(f"  Lighter: {len(lighter_addresses)}")
-        logger.info(f"  Top transferred: {len(top_transferred)}")
+        # Save unmapped tokens for manual review while the summary is printed
+        save_task = asyncio.create_task(self._save_unmapped_tokens())
 
-        # Show tokens matched by multiple sources
-        multi_source = {
-            token: sources
-            for token, sources in self.token_sources.items()
-            if len(sources) > 1
+        # Count by source once; reused for the summary and the result
+        breakdown = {
+            "cross_chain": len(cross_chain),
+            "hyperliquid": len(hyperliquid_addresses),
+            "lighter": len(lighter_addresses),
+            "top_transferred": len(top_transferred),
         }
 
-        if multi_source:
-            print(f"\n✨ Tokens from multiple sources ({len(multi_source)}):")
-            for token, sources in sorted(
-                multi_source.items(), key=lambda x: -len(x[1])
-            )[:20]:
-                info = self.token_info.get(token, {})
-                symbol = info.get("symbol", "?")
-                logger.info(f"  {symbol:8s} {token[:10]}... - {', '.join(sources)}")
+        # Print summary as a single log record
+        lines = [
+            "=" * 70,
+            "📈 Whitelist Summary",
+            "=" * 70,
+            f"Total whitelisted tokens: {len(self.whitelist_tokens)}",
+            "",
+            "By source:",
+            f"  Cross-chain: {breakdown['cross_chain']}",
+            f"  Hyperliquid: {breakdown['hyperliquid']}",
+            f"  Lighter: {breakdown['lighter']}",
+            f"  Top transferred: {breakdown['top_transferred']}",
+        ]
 
-        # Save unmapped tokens for manual review
-        await self._save_unmapped_tokens()
+        # Show tokens matched by multiple sources
+        multi_count = sum(1 for s in self.token_sources.values() if len(s) > 1)
+
+        if multi_count:
+            lines += ["", f"✨ Tokens from multiple sources ({multi_count}):"]
+            top20 = heapq.nlargest(
+                20,
+                ((t, s) for t, s in self.token_sources.items() if len(s) > 1),
+                key=lambda x: len(x[1]),
+            )
+            lines.extend(
+                f"  {self.token_info.get(token, _EMPTY).get('symbol', '?'):8s} "
+                f"{token[:10]}... - {', '.join(sources)}"
+                for token, sources in top20
+            )
+
+        logger.info("\n".join(lines))
+
+        await save_task
 
         # Return whitelist only - pool filtering is handled by PoolFilter class
         # NOTE: The rpc_url and min_liquidity parameters are deprecated - use PoolFilter instead
+        # Expose read-only views so callers can't mutate builder state in place
+        result = self._base_state()
+        result.update(
+            {
+                "token_sources": MappingProxyType(result["token_sources"]),
+                "token_info": MappingProxyType(self.token_info),
+                "breakdown": breakdown,
+                "unmapped_hyperliquid": self.unmapped_hyperliquid,
+                "unmapped_lighter": self.unmapped_lighter,
+            }
+        )
+        return result
+
+    def _base_state(self) -> Dict:
+        """Whitelist fields shared by build_whitelist() and the saved JSON file."""
         return {
             "total_tokens": len(self.whitelist_tokens),
-            "tokens": sorted(list(self.whitelist_tokens)),
-            "token_sources": self.token_sources,
+            "tokens": self._sorted_tokens,
+            "token_sources": dict(self.token_sources),
             "token_info": self.token_info,
-            "breakdown": {
-                "cross_chain": len(cross_chain),
-                "hyperliquid": len(hyperliquid_addresses),
-                "lighter": len(lighter_addresses),
-                "top_transferred": len(top_transferred),
-            },
-            "unmapped_hyperliquid": self.unmapped_hyperliquid,
-            "unmapped_lighter": self.unmapped_lighter,
         }
 
-    def save_whitelist(self, output_path: str):
-        """Save whitelist to JSON file."""
-        data = {
-            "total_tokens": len(self.whitelist_tokens),
-            "tokens": sorted(list(self.whitelist_tokens)),
-            "token_sources": self.token_sources,
-            "token_info": self.token_info,
-        }
+    async def save_whitelist(self, output_path: str):
+        """
+        Save whitelist to JSON file without blocking the event loop.
 
-        with open(output_path, "w") as f:
-            json.dump(data, f, indent=2)
+        Args:
+            output_path: Destination path; a ".gz" suffix writes gzip-compressed JSON
+        """
+        await asyncio.to_thread(_write_json, output_path, self._base_state())
 
         print(f"\n💾 Saved whitelist to {output_path}")
 
@@ -881,8 +987,8 @@ async def main():
         "user": config.database.POSTGRES_USER,
         "password": config.database.POSTGRES_PASSWORD,
         "database": config.database.POSTGRES_DB,
-        "pool_size": 10,
-        "pool_timeout": 10,
+        "pool_size": config.database.MAX_CONNECTIONS,
+        "pool_timeout": config.database.CONNECTION_TIMEOUT,
     }
 
     storage = PostgresStorage(config=db_config)
@@ -895,9 +1001,9 @@ async def main():
         result = await builder.build_whitelist(top_transfers=100)
 
         # Save to file
-        output_path = Path(project_root) / "data" / "token_whitelist.json"
+        output_path = config.base.DATA_DIR / "token_whitelist.json.gz"
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        builder.save_whitelist(str(output_path))
+        await builder.save_whitelist(str(output_path))
 
         print("\n✅ Whitelist building complete!")
 
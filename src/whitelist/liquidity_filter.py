@@ -5,11 +5,15 @@ Filters pools based on minimum dollar notional value of reserves/liquidity.
 """
 
 import asyncio
+import json
 import logging
+import math
 import sys
+import time
 from decimal import Decimal
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
 from web3 import Web3
 
@@ -31,6 +35,127 @@ from .v3_math import get_amount0_delta, get_amount1_delta, get_sqrt_ratio_at_tic
 ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
 WETH_ADDRESS = "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"  # Ethereum mainnet WETH
 
+# Decimals that never change for the most common Ethereum mainnet tokens
+KNOWN_TOKEN_DECIMALS: Dict[str, int] = {
+    ZERO_ADDRESS: 18,  # native ETH (V4)
+    "0xc02aaa39b223fe8d0a0e5c4f27ead9083c756cc2": 18,  # WETH
+    "0xa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48": 6,  # USDC
+    "0xdac17f958d2ee523a2206206994597c13d831ec7": 6,  # USDT
+    "0x6b175474e89094c44da98b954eedeac495271d0f": 18,  # DAI
+    "0x2260fac5e5542a773aa44fbcfedf7c193bc2c599": 8,  # WBTC
+}
+
+# Exchange price snapshots are reused for this long within one process
+EXCHANGE_PRICE_TTL_SECONDS = 30
+
+# On-disk cache of pool-discovered token prices, seeded into the next run
+PRICE_CACHE_DIR = Path("data/price_cache")
+DISCOVERED_PRICE_CACHE_TTL = 3600  # seconds - coarse, only used for thresholds
+
+# 2**192 as a Decimal; a squared sqrtPriceX96 over this is the raw price ratio
+_Q192 = Decimal(1 << 192)
+
+# Powers of ten for every ERC20 decimals value (uint8), built once at import
+_POW10 = tuple(Decimal(10) ** i for i in range(256))
+
+
+def _pow10(exponent: int) -> Decimal:
+    """Return 10**exponent as a Decimal, using the precomputed table."""
+    if exponent >= 0:
+        return _POW10[exponent]
+    return 1 / _POW10[-exponent]
+
+
+# Float counterpart used by the price discovery loops
+_POW10_FLOAT = tuple(10.0**i for i in range(256))
+
+
+def _sqrt_price_x96_to_float(
+    sqrt_price_x96: int, decimals0: int, decimals1: int
+) -> float:
+    """
+    Convert a V3/V4 sqrtPriceX96 into the decimal-adjusted token0 price in token1.
+
+    The squared price (at most 320 bits) converts to a correctly rounded
+    float, and ldexp applies the 2**-192 scale exactly, so no Decimal or
+    big-int division is needed.
+    """
+    price_ratio = math.ldexp(sqrt_price_x96 * sqrt_price_x96, -192)
+    if decimals0 >= decimals1:
+        return price_ratio * _POW10_FLOAT[decimals0 - decimals1]
+    return price_ratio / _POW10_FLOAT[decimals1 - decimals0]
+
+
+@lru_cache(maxsize=1 << 16)
+def _active_range_amounts_per_liquidity(tick: int) -> Tuple[float, float]:
+    """
+    Token0/token1 raw amounts per unit of liquidity within tick +/- 100.
+
+    Both amounts are linear in liquidity, so a pool whose token prices are
+    already known needs just two float multiplies instead of the bigint
+    get_amount0_delta/get_amount1_delta calls.
+    """
+    sqrt_ratio_a = get_sqrt_ratio_at_tick(tick - 100)
+    sqrt_ratio_b = get_sqrt_ratio_at_tick(tick + 100)
+    delta = sqrt_ratio_b - sqrt_ratio_a
+    return (delta << 96) / (sqrt_ratio_a * sqrt_ratio_b), math.ldexp(delta, -96)
+
+
+def _decode_v2_reserves(reserves: Dict[str, Dict]) -> Dict[str, Tuple[int, int]]:
+    """
+    Flatten UniswapV2ReservesBatcher results into (reserve0, reserve1) tuples.
+
+    Incomplete entries are dropped, so each pool's reserves are looked up once
+    per fetch rather than once per row that references the pool.
+    """
+    decoded = {}
+    for pool_addr, data in reserves.items():
+        try:
+            decoded[pool_addr] = (data["reserve0"], data["reserve1"])
+        except (KeyError, TypeError):
+            continue
+    return decoded
+
+
+# Candidate pools for one price discovery round, tagged by protocol version.
+# $1/$2/$3 are V2/V3/V4 factories, $4 unpriced tokens, $5 priced tokens.
+DISCOVERY_POOLS_QUERY = """
+SELECT DISTINCT
+    LOWER(address) as pool_address,
+    LOWER(asset0) as token0,
+    LOWER(asset1) as token1,
+    CASE
+        WHEN LOWER(factory) = ANY($1) THEN 'v2'
+        WHEN LOWER(factory) = ANY($2) THEN 'v3'
+        ELSE 'v4'
+    END as version
+FROM (
+    SELECT address, asset0, asset1, factory FROM network_1__dex_pools
+    UNION
+    SELECT address, asset0, asset1, factory FROM network_1_dex_pools_cryo
+) pools
+WHERE (
+    LOWER(factory) = ANY($1)
+    OR LOWER(factory) = ANY($2)
+    OR LOWER(factory) = ANY($3)
+)
+AND (
+    (LOWER(asset0) = ANY($4) AND LOWER(asset1) = ANY($5))
+    OR
+    (LOWER(asset0) = ANY($5) AND LOWER(asset1) = ANY($4))
+)
+"""
+
+
+# Wrapped tokens are priced off their underlying asset's exchange symbol
+PRICE_SYMBOL_ALIASES = {"WETH": "ETH", "WBTC": "BTC"}
+
+
+def _price_symbol(symbol: str) -> str:
+    """Return the uppercase exchange symbol used to price a token symbol."""
+    symbol_upper = symbol.upper()
+    return PRICE_SYMBOL_ALIASES.get(symbol_upper, symbol_upper)
+
 
 def normalize_token_for_pricing(address: str) -> str:
     """
@@ -77,11 +202,13 @@ class PoolLiquidityFilter:
             use_reth_db: Whether to use Reth DB if available (default: True)
         """
         self.web3 = web3
-        self.min_liquidity_v2_usd = Decimal(str(min_liquidity_v2_usd))
-        self.min_liquidity_v3_usd = Decimal(str(min_liquidity_v3_usd))
-        self.min_liquidity_v4_usd = Decimal(str(min_liquidity_v4_usd))
+        self.min_liquidity_v2_usd = float(min_liquidity_v2_usd)
+        self.min_liquidity_v3_usd = float(min_liquidity_v3_usd)
+        self.min_liquidity_v4_usd = float(min_liquidity_v4_usd)
         self.chain = chain
         self.prices: Dict[str, Decimal] = {}  # token_address -> price in USD
+        # exchange -> (monotonic fetch time, symbol prices) from the last fetch
+        self._exchange_price_cache: Dict[str, Tuple[float, Dict[str, float]]] = {}
 
         # Reth DB integration
         self.reth_loader = None
@@ -121,14 +248,22 @@ class PoolLiquidityFilter:
         Returns:
             Combined dict with existing + newly fetched decimals
         """
-        from src.batchers.base import BatchConfig
-        from src.batchers.erc20_metadata import ERC20MetadataBatcher
+        # Fill well-known tokens without an RPC round-trip
+        combined = dict(existing_decimals)
+        for addr in token_addresses:
+            if addr not in combined:
+                known = KNOWN_TOKEN_DECIMALS.get(addr.lower())
+                if known is not None:
+                    combined[addr] = known
 
-        # Find tokens missing decimals
-        missing = [addr for addr in token_addresses if addr not in existing_decimals]
+        # Find tokens still missing decimals
+        missing = [addr for addr in token_addresses if addr not in combined]
 
         if not missing:
-            return existing_decimals
+            return combined
+
+        from src.batchers.base import BatchConfig
+        from src.batchers.erc20_metadata import ERC20MetadataBatcher
 
         logger.info(f"🔍 Fetching decimals on-chain for {len(missing)} tokens...")
 
@@ -138,7 +273,6 @@ class PoolLiquidityFilter:
         metadata = await erc20_batcher.fetch_metadata_chunked(missing)
 
         # Combine
-        combined = dict(existing_decimals)
         newly_fetched = 0
 
         for addr, meta in metadata.items():
@@ -150,13 +284,93 @@ class PoolLiquidityFilter:
 
         return combined
 
-    async def fetch_hyperliquid_prices(self) -> Dict[str, Decimal]:
+    def _get_cached_exchange_prices(self, exchange: str) -> Optional[Dict[str, float]]:
+        """Return a copy of the exchange's last prices if still within the TTL."""
+        cached = self._exchange_price_cache.get(exchange)
+        if cached is None:
+            return None
+
+        fetched_at, prices = cached
+        if time.monotonic() - fetched_at >= EXCHANGE_PRICE_TTL_SECONDS:
+            return None
+
+        logger.info(f"📊 Reusing {len(prices)} cached {exchange} prices")
+        return dict(prices)
+
+    def _cache_exchange_prices(self, exchange: str, prices: Dict[str, float]) -> None:
+        """Remember a successful exchange price fetch (empty results aren't cached)."""
+        if prices:
+            self._exchange_price_cache[exchange] = (time.monotonic(), dict(prices))
+
+    def _discovered_price_cache_path(self) -> Path:
+        return PRICE_CACHE_DIR / f"{self.chain}_discovered_prices.json"
+
+    def _load_discovered_price_cache(self) -> Dict[str, Tuple[Decimal, float]]:
+        """
+        Load discovered token prices from disk, skipping expired entries.
+
+        Returns:
+            Dict of token_address -> (price, time.time() when it was discovered)
+        """
+        cache_path = self._discovered_price_cache_path()
+        if not cache_path.exists():
+            return {}
+
+        try:
+            with open(cache_path, "r") as f:
+                cached = json.load(f)
+        except Exception as e:
+            logger.warning(f"Failed to load discovered price cache: {e}")
+            return {}
+
+        # Each entry carries its own discovery time, so a price expires
+        # DISCOVERED_PRICE_CACHE_TTL after it was found on a pool no matter
+        # how often the file is rewritten
+        now = time.time()
+        entries = {}
+        for addr, entry in cached.get("prices", {}).items():
+            try:
+                ts = float(entry["ts"])
+                if now - ts < DISCOVERED_PRICE_CACHE_TTL:
+                    entries[addr] = (Decimal(entry["price"]), ts)
+            except (KeyError, TypeError, ValueError, ArithmeticError):
+                continue
+        return entries
+
+    def _save_discovered_price_cache(
+        self, entries: Dict[str, Tuple[Decimal, float]]
+    ) -> None:
+        """Save discovered token prices with their discovery times for the next run."""
+        cache_path = self._discovered_price_cache_path()
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename so a concurrent reader never sees a partial file
+            tmp_path = cache_path.with_suffix(".tmp")
+            with open(tmp_path, "w") as f:
+                json.dump(
+                    {
+                        "prices": {
+                            addr: {"price": str(price), "ts": ts}
+                            for addr, (price, ts) in entries.items()
+                        }
+                    },
+                    f,
+                )
+            tmp_path.replace(cache_path)
+        except Exception as e:
+            logger.warning(f"Failed to save discovered price cache: {e}")
+
+    async def fetch_hyperliquid_prices(self) -> Dict[str, float]:
         """
         Fetch current prices from Hyperliquid perp markets (use as proxy for spot).
 
         Returns:
             Dictionary mapping token symbols to prices in USD
         """
+        cached = self._get_cached_exchange_prices("hyperliquid")
+        if cached is not None:
+            return cached
+
         logger.info("📊 Fetching Hyperliquid perp prices...")
 
         try:
@@ -171,19 +385,24 @@ class PoolLiquidityFilter:
             perp_prices = {}
             tokens_data = result.metadata.get("tokens", [])
 
+            # Skip building per-item debug messages unless DEBUG is on
+            debug = logger.isEnabledFor(logging.DEBUG)
+
             for token in tokens_data:
                 base_symbol = token.base.upper()
                 # Extract oracle price from additional_data
                 try:
                     oracle_px = token.additional_data.get("info", {}).get("oraclePx")
                     if oracle_px:
-                        price = Decimal(str(oracle_px))
+                        price = float(oracle_px)
                         perp_prices[base_symbol] = price
-                        logger.debug(f"  {base_symbol}: ${price}")
+                        if debug:
+                            logger.debug(f"  {base_symbol}: ${price}")
                 except (ValueError, TypeError, AttributeError) as e:
                     continue
 
             logger.info(f"  Fetched {len(perp_prices)} perp prices from Hyperliquid")
+            self._cache_exchange_prices("hyperliquid", perp_prices)
             return perp_prices
 
         except Exception as e:
@@ -193,13 +412,17 @@ class PoolLiquidityFilter:
             traceback.print_exc()
             return {}
 
-    async def fetch_binance_prices(self) -> Dict[str, Decimal]:
+    async def fetch_binance_prices(self) -> Dict[str, float]:
         """
         Fetch current prices from Binance spot markets.
 
         Returns:
             Dictionary mapping token symbols to prices in USD
         """
+        cached = self._get_cached_exchange_prices("binance")
+        if cached is not None:
+            return cached
+
         logger.info("💹 Fetching Binance spot prices...")
 
         try:
@@ -218,11 +441,14 @@ class PoolLiquidityFilter:
 
             # For Binance, we need to fetch current ticker prices
             # The market data just tells us which markets exist
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             tickers = await loop.run_in_executor(
                 None, fetcher.ccxt_exchange.fetchTickers
             )
 
+            # Skip building per-item debug messages unless DEBUG is on
+            debug = logger.isEnabledFor(logging.DEBUG)
+
             for token in tokens_data:
                 base_symbol = token.base.upper()
                 quote_symbol = token.quote.upper()
@@ -239,32 +465,37 @@ class PoolLiquidityFilter:
                     continue
 
                 try:
-                    price = Decimal(str(last_price))
+                    price = float(last_price)
 
                     # Convert to USD if quote is not USD-based
                     if quote_symbol in ["USDT", "USDC", "BUSD", "USD"]:
                         # Already in USD terms
                         spot_prices[base_symbol] = price
-                        logger.debug(f"  {base_symbol}: ${price}")
+                        if debug:
+                            logger.debug(f"  {base_symbol}: ${price}")
                     elif quote_symbol == "BTC" and "BTC" in spot_prices:
                         # Convert BTC-quoted price to USD
                         btc_price = spot_prices["BTC"]
                         usd_price = price * btc_price
                         spot_prices[base_symbol] = usd_price
-                        logger.debug(f"  {base_symbol}: ${usd_price} (via BTC)")
+                        if debug:
+                            logger.debug(f"  {base_symbol}: ${usd_price} (via BTC)")
                     elif quote_symbol == "ETH" and "ETH" in spot_prices:
                         # Convert ETH-quoted price to USD
                         eth_price = spot_prices["ETH"]
                         usd_price = price * eth_price
                         spot_prices[base_symbol] = usd_price
-                        logger.debug(f"  {base_symbol}: ${usd_price} (via ETH)")
+                        if debug:
+                            logger.debug(f"  {base_symbol}: ${usd_price} (via ETH)")
                     # else: skip non-USD pairs we can't convert
 
                 except (ValueError, TypeError) as e:
-                    logger.debug(f"  Invalid price for {symbol}: {e}")
+                    if debug:
+                        logger.debug(f"  Invalid price for {symbol}: {e}")
                     continue
 
             logger.info(f"  Fetched {len(spot_prices)} spot prices from Binance")
+            self._cache_exchange_prices("binance", spot_prices)
             return spot_prices
 
         except Exception as e:
@@ -274,433 +505,324 @@ class PoolLiquidityFilter:
             traceback.print_exc()
             return {}
 
-    async def discover_prices_from_v2_pools(
+    async def discover_prices_from_all_pools(
         self,
         storage,
         all_tokens: set,
         initial_prices: Dict[str, Decimal],
         token_decimals: Dict[str, int],
         v2_factories: list,
+        v3_factories: list,
+        v4_factories: list,
         max_iterations: int = 10,
+        fetched_states: Optional[Dict[str, Dict[str, Dict]]] = None,
     ) -> Dict[str, Decimal]:
         """
-        Iteratively discover token prices through V2 pools.
+        Iteratively discover token prices through V2, V3 and V4 pools together.
+
+        Each round runs one query that tags every candidate pool with its
+        protocol version and starts the V3/V4 pool state fetches in the
+        background. V2 reserves are streamed chunk by chunk and priced as each
+        chunk arrives, then V3 and V4 rows are priced once their state is in.
 
-        Algorithm:
-        1. Start with initial_prices (from exchanges)
-        2. Find V2 pools with (unpricedToken, pricedToken)
-        3. Fetch reserves and calculate price for unpricedToken
-        4. Add to price dictionary
-        5. Repeat until no new prices or max_iterations reached
+        max_iterations is one budget shared by all three protocols: a token
+        can be reached through at most max_iterations hops, whichever mix of
+        V2/V3/V4 pools the path uses. (The separate per-protocol passes this
+        replaced each had their own budget, so a V2 -> V3 -> V4 run could take
+        up to 3 * max_iterations rounds, but a path could never return to an
+        earlier protocol.)
 
         Args:
             storage: PostgresStorage instance for database queries
             all_tokens: Set of all token addresses we care about
             initial_prices: Dict of token_address -> price (from exchanges)
-            token_decimals: Dict of token_address -> decimals (will fetch missing on-chain)
+            token_decimals: Dict of token_address -> decimals
             v2_factories: List of V2 factory addresses
+            v3_factories: List of V3 factory addresses
+            v4_factories: List of V4 factory addresses
             max_iterations: Maximum number of discovery rounds
+            fetched_states: Optional dict of version ("v2"/"v3"/"v4") ->
+                {pool_address: reserves/state}; every batch fetched during
+                discovery is added to it so callers can reuse the data
 
         Returns:
             Dict of token_address -> price with all discovered prices
         """
-        from src.batchers.uniswap_v2_reserves import UniswapV2ReservesBatcher
+        from src.batchers.base import BatchConfig
 
-        logger.info("🔍 V2 Price Discovery Starting...")
+        logger.info("🔍 V2/V3/V4 Price Discovery Starting...")
         logger.info(f"   Starting with {len(initial_prices)} prices")
 
         # Initialize
         prices = dict(initial_prices)
         tokens_with_prices = set(prices.keys())
-        tokens_without_prices = all_tokens - tokens_with_prices
+        # Lowercase once; both sets are kept lowercase as prices are found
+        tokens_without_prices = {
+            addr.lower() for addr in all_tokens
+        } - tokens_with_prices
 
         v2_batcher = UniswapV2ReservesBatcher(self.web3)
+        v3_batcher = UniswapV3DataBatcher(self.web3, config=BatchConfig(batch_size=50))
+        v4_batcher = UniswapV4DataBatcher(self.web3, config=BatchConfig(batch_size=50))
 
-        for iteration in range(max_iterations):
-            if not tokens_without_prices:
-                logger.info(f"   ✅ All tokens priced after {iteration} iterations!")
-                break
-
-            # Query V2 pools where one token has price, other doesn't
-            query = """
-            SELECT DISTINCT
-                address as pool_address,
-                asset0 as token0,
-                asset1 as token1
-            FROM (
-                SELECT address, asset0, asset1 FROM network_1__dex_pools
-                WHERE LOWER(factory) = ANY($1)
-                UNION
-                SELECT address, asset0, asset1 FROM network_1_dex_pools_cryo
-                WHERE LOWER(factory) = ANY($1)
-            ) pools
-            WHERE (
-                (LOWER(asset0) = ANY($2) AND LOWER(asset1) = ANY($3))
-                OR
-                (LOWER(asset0) = ANY($3) AND LOWER(asset1) = ANY($2))
-            )
-            """
-
-            async with storage.pool.acquire() as conn:
-                results = await conn.fetch(
-                    query,
-                    [f.lower() for f in v2_factories],
-                    [addr.lower() for addr in tokens_without_prices],
-                    [addr.lower() for addr in tokens_with_prices],
-                )
-
-            if not results:
-                break
+        v2_factories_lower = [f.lower() for f in v2_factories]
+        v3_factories_lower = [f.lower() for f in v3_factories]
+        v4_factories_lower = [f.lower() for f in v4_factories]
 
-            # Fetch reserves
-            pool_addresses = [row["pool_address"].lower() for row in results]
-            reserves = await v2_batcher.fetch_reserves_chunked(pool_addresses)
+        # Pools between unpriced tokens and tokens priced in earlier rounds were
+        # already returned by those rounds, so each round only queries pools
+        # touching the tokens priced in the round before (the frontier)
+        frontier = set(tokens_with_prices)
 
-            # Calculate prices
-            new_prices_found = 0
-            for row in results:
-                pool_addr = row["pool_address"].lower()
-                token0 = row["token0"].lower()
-                token1 = row["token1"].lower()
+        # Hold one connection and prepare the discovery query once for all rounds
+        async with storage.pool.acquire() as conn:
+            discovery_stmt = await conn.prepare(DISCOVERY_POOLS_QUERY)
 
-                reserve_data = reserves.get(pool_addr)
-                if not reserve_data:
-                    continue
+            for iteration in range(max_iterations):
+                if not tokens_without_prices:
+                    logger.info(
+                        f"   ✅ All tokens priced after {iteration} iterations!"
+                    )
+                    break
+
+                results = await discovery_stmt.fetch(
+                    v2_factories_lower,
+                    v3_factories_lower,
+                    v4_factories_lower,
+                    list(tokens_without_prices),
+                    list(frontier),
+                )
+                priced_before = set(tokens_with_prices)
+
+                if not results:
+                    break
+
+                # Addresses come back lowercased and DISTINCT, so each pool
+                # appears once
+                rows_by_version = {"v2": [], "v3": [], "v4": []}
+                pools_by_version = {"v2": [], "v3": [], "v4": []}
+                for row in results:
+                    rows_by_version[row["version"]].append(
+                        (row["pool_address"], row["token0"], row["token1"])
+                    )
+                    pools_by_version[row["version"]].append(row["pool_address"])
 
+                # On-chain fetches for the three protocols are independent:
+                # V3/V4 state is fetched in the background while V2 reserves
+                # stream in and are priced chunk by chunk
+                v3_task = asyncio.ensure_future(
+                    v3_batcher.fetch_pools_chunked(pools_by_version["v3"])
+                )
+                v4_task = asyncio.ensure_future(
+                    v4_batcher.fetch_pools_chunked(pools_by_version["v4"])
+                )
                 try:
-                    reserve0 = Decimal(str(int(reserve_data["reserve0"], 16)))
-                    reserve1 = Decimal(str(int(reserve_data["reserve1"], 16)))
-
-                    if reserve0 == 0 or reserve1 == 0:
-                        continue
-
-                    decimals0 = token_decimals.get(token0)
-                    decimals1 = token_decimals.get(token1)
-
-                    if decimals0 is None or decimals1 is None:
-                        continue
-
-                    # Calculate price using the token that has a known price
-                    if token0 in tokens_with_prices and token1 in tokens_without_prices:
-                        price0 = prices[token0]
-                        # Adjust for decimals and calculate
-                        adj_reserve0 = reserve0 / Decimal(10**decimals0)
-                        adj_reserve1 = reserve1 / Decimal(10**decimals1)
-                        price1 = (adj_reserve0 / adj_reserve1) * price0
-
-                        prices[token1] = price1
-                        tokens_with_prices.add(token1)
-                        tokens_without_prices.discard(token1)
-                        new_prices_found += 1
-
-                    elif (
-                        token1 in tokens_with_prices and token0 in tokens_without_prices
+                    v2_rows_by_pool = {row[0]: row for row in rows_by_version["v2"]}
+                    new_prices_found = 0
+                    async for chunk_reserves in v2_batcher.iter_reserves_chunked(
+                        pools_by_version["v2"]
                     ):
-                        price1 = prices[token1]
-                        adj_reserve0 = reserve0 / Decimal(10**decimals0)
-                        adj_reserve1 = reserve1 / Decimal(10**decimals1)
-                        price0 = (adj_reserve1 / adj_reserve0) * price1
-
-                        prices[token0] = price0
-                        tokens_with_prices.add(token0)
-                        tokens_without_prices.discard(token0)
-                        new_prices_found += 1
+                        if fetched_states is not None:
+                            fetched_states.setdefault("v2", {}).update(chunk_reserves)
+                        new_prices_found += self._price_rows_from_reserves(
+                            [
+                                v2_rows_by_pool[pool_addr]
+                                for pool_addr in chunk_reserves
+                                if pool_addr in v2_rows_by_pool
+                            ],
+                            _decode_v2_reserves(chunk_reserves),
+                            prices,
+                            tokens_with_prices,
+                            tokens_without_prices,
+                            token_decimals,
+                        )
+
+                    v3_states, v4_states = await asyncio.gather(v3_task, v4_task)
+                finally:
+                    v3_task.cancel()
+                    v4_task.cancel()
+
+                if fetched_states is not None:
+                    fetched_states.setdefault("v3", {}).update(v3_states)
+                    fetched_states.setdefault("v4", {}).update(v4_states)
+
+                # Calculate V3/V4 prices once V2 chunks are priced
+                new_prices_found += self._price_rows_from_sqrt_prices(
+                    rows_by_version["v3"],
+                    v3_states,
+                    prices,
+                    tokens_with_prices,
+                    tokens_without_prices,
+                    token_decimals,
+                )
+                new_prices_found += self._price_rows_from_sqrt_prices(
+                    rows_by_version["v4"],
+                    v4_states,
+                    prices,
+                    tokens_with_prices,
+                    tokens_without_prices,
+                    token_decimals,
+                    normalize=normalize_token_for_pricing,
+                )
 
-                except (ValueError, KeyError, ZeroDivisionError):
-                    continue
+                if new_prices_found == 0:
+                    break
 
-            if new_prices_found == 0:
-                break
+                frontier = tokens_with_prices - priced_before
 
         logger.info(
-            f"   ✅ V2 Discovery: {len(prices) - len(initial_prices)} new prices"
+            f"   ✅ V2/V3/V4 Discovery: {len(prices) - len(initial_prices)} new prices"
         )
         return prices
 
-    async def discover_prices_from_v3_pools(
+    def _price_rows_from_reserves(
         self,
-        storage,
-        all_tokens: set,
-        initial_prices: Dict[str, Decimal],
+        rows: List[Tuple[str, str, str]],
+        reserves: Dict[str, Tuple[int, int]],
+        prices: Dict[str, Decimal],
+        tokens_with_prices: Set[str],
+        tokens_without_prices: Set[str],
         token_decimals: Dict[str, int],
-        v3_factories: list,
-        max_iterations: int = 10,
-    ) -> Dict[str, Decimal]:
+    ) -> int:
         """
-        Iteratively discover token prices through V3 pools using sqrtPriceX96.
+        Price unpriced tokens from V2 reserves, updating the price sets in place.
 
         Args:
-            storage: PostgresStorage instance for database queries
-            all_tokens: Set of all token addresses we care about
-            initial_prices: Dict of token_address -> price (from exchanges + V2)
-            token_decimals: Dict of token_address -> decimals (will fetch missing on-chain)
-            v3_factories: List of V3 factory addresses
-            max_iterations: Maximum number of discovery rounds
+            rows: (pool_address, token0, token1) tuples, lowercased
+            reserves: Dict of pool_address -> (reserve0, reserve1), see
+                _decode_v2_reserves
+            prices: Dict of token_address -> price, updated in place
+            tokens_with_prices: Set of priced tokens, updated in place
+            tokens_without_prices: Set of unpriced tokens, updated in place
+            token_decimals: Dict of token_address -> decimals
 
         Returns:
-            Dict of token_address -> price with all discovered prices
+            Number of new prices found
         """
-        from src.batchers.base import BatchConfig
-        from src.batchers.uniswap_v3_data import UniswapV3DataBatcher
-
-        logger.info("🔍 V3 Price Discovery Starting...")
-        logger.info(f"   Starting with {len(initial_prices)} prices")
-
-        # Initialize
-        prices = dict(initial_prices)
-        tokens_with_prices = set(prices.keys())
-        tokens_without_prices = all_tokens - tokens_with_prices
-
-        batch_config = BatchConfig(batch_size=50)
-        v3_batcher = UniswapV3DataBatcher(self.web3, config=batch_config)
-
-        for iteration in range(max_iterations):
-            if not tokens_without_prices:
-                logger.info(f"   ✅ All tokens priced after {iteration} iterations!")
-                break
-
-            # Query V3 pools where one token has price, other doesn't
-            # Query BOTH tables to get all V3 pools
-            query = """
-            SELECT DISTINCT
-                address as pool_address,
-                asset0 as token0,
-                asset1 as token1
-            FROM (
-                SELECT address, asset0, asset1, factory FROM network_1__dex_pools
-                UNION
-                SELECT address, asset0, asset1, factory FROM network_1_dex_pools_cryo
-            ) pools
-            WHERE LOWER(factory) = ANY($1)
-            AND (
-                (LOWER(asset0) = ANY($2) AND LOWER(asset1) = ANY($3))
-                OR
-                (LOWER(asset0) = ANY($3) AND LOWER(asset1) = ANY($2))
-            )
-            """
-
-            async with storage.pool.acquire() as conn:
-                results = await conn.fetch(
-                    query,
-                    [f.lower() for f in v3_factories],
-                    [addr.lower() for addr in tokens_without_prices],
-                    [addr.lower() for addr in tokens_with_prices],
-                )
-
-            if not results:
-                break
-
-            # Fetch pool states
-            pool_addresses = [row["pool_address"].lower() for row in results]
-            pool_states = await v3_batcher.fetch_pools_chunked(pool_addresses)
+        new_prices_found = 0
+        for pool_addr, token0, token1 in rows:
+            reserve_pair = reserves.get(pool_addr)
+            if not reserve_pair:
+                continue
 
-            # Calculate prices
-            new_prices_found = 0
-            for row in results:
-                pool_addr = row["pool_address"].lower()
-                token0 = row["token0"].lower()
-                token1 = row["token1"].lower()
+            try:
+                reserve0, reserve1 = reserve_pair
 
-                state = pool_states.get(pool_addr)
-                if not state:
+                if reserve0 == 0 or reserve1 == 0:
                     continue
 
-                try:
-                    sqrt_price_x96 = int(state["sqrtPriceX96"])
-                    if sqrt_price_x96 == 0:
-                        continue
-
-                    decimals0 = token_decimals.get(token0)
-                    decimals1 = token_decimals.get(token1)
-
-                    if decimals0 is None or decimals1 is None:
-                        continue
-
-                    # Calculate price ratio from sqrtPriceX96
-                    # price = (sqrtPriceX96 / 2^96)^2 * (10^decimals0 / 10^decimals1)
-                    price_ratio = Decimal(sqrt_price_x96**2) / Decimal(2**192)
-                    decimals_adjustment = Decimal(10 ** (decimals0 - decimals1))
-                    price_token0_in_token1 = price_ratio * decimals_adjustment
-
-                    # Determine which token has price and calculate the other
-                    if token0 in tokens_with_prices and token1 in tokens_without_prices:
-                        price0 = prices[token0]
-                        if price_token0_in_token1 > 0:
-                            price1 = price0 / price_token0_in_token1
-                            prices[token1] = price1
-                            tokens_with_prices.add(token1)
-                            tokens_without_prices.discard(token1)
-                            new_prices_found += 1
-
-                    elif (
-                        token1 in tokens_with_prices and token0 in tokens_without_prices
-                    ):
-                        price1 = prices[token1]
-                        price0 = price1 * price_token0_in_token1
-                        prices[token0] = price0
-                        tokens_with_prices.add(token0)
-                        tokens_without_prices.discard(token0)
-                        new_prices_found += 1
+                decimals0 = token_decimals.get(token0)
+                decimals1 = token_decimals.get(token1)
 
-                except (ValueError, KeyError, ZeroDivisionError, TypeError):
+                if decimals0 is None or decimals1 is None:
                     continue
 
-            if new_prices_found == 0:
-                break
+                # Calculate price using the token that has a known price.
+                # Float math is plenty for a USD estimate; only the stored
+                # price is widened back to Decimal.
+                if token0 in tokens_with_prices and token1 in tokens_without_prices:
+                    price0 = float(prices[token0])
+                    # Adjust for decimals and calculate
+                    adj_reserve0 = reserve0 / _POW10_FLOAT[decimals0]
+                    adj_reserve1 = reserve1 / _POW10_FLOAT[decimals1]
+                    price1 = (adj_reserve0 / adj_reserve1) * price0
+
+                    prices[token1] = Decimal(repr(price1))
+                    tokens_with_prices.add(token1)
+                    tokens_without_prices.discard(token1)
+                    new_prices_found += 1
+
+                elif token1 in tokens_with_prices and token0 in tokens_without_prices:
+                    price1 = float(prices[token1])
+                    adj_reserve0 = reserve0 / _POW10_FLOAT[decimals0]
+                    adj_reserve1 = reserve1 / _POW10_FLOAT[decimals1]
+                    price0 = (adj_reserve1 / adj_reserve0) * price1
+
+                    prices[token0] = Decimal(repr(price0))
+                    tokens_with_prices.add(token0)
+                    tokens_without_prices.discard(token0)
+                    new_prices_found += 1
+
+            except (ValueError, KeyError, ZeroDivisionError):
+                continue
 
-        logger.info(
-            f"   ✅ V3 Discovery: {len(prices) - len(initial_prices)} new prices"
-        )
-        return prices
+        return new_prices_found
 
-    async def discover_prices_from_v4_pools(
+    def _price_rows_from_sqrt_prices(
         self,
-        storage,
-        all_tokens: set,
-        initial_prices: Dict[str, Decimal],
+        rows: List[Tuple[str, str, str]],
+        pool_states: Dict[str, Dict],
+        prices: Dict[str, Decimal],
+        tokens_with_prices: Set[str],
+        tokens_without_prices: Set[str],
         token_decimals: Dict[str, int],
-        v4_factories: list,
-        max_iterations: int = 10,
-    ) -> Dict[str, Decimal]:
+        normalize: Optional[Callable[[str], str]] = None,
+    ) -> int:
         """
-        Iteratively discover token prices through V4 pools using sqrtPriceX96.
-
-        V4 uses the same pricing formula as V3, but stores pools by pool_id (hash)
-        and uses zero address for native ETH.
+        Price unpriced tokens from V3/V4 sqrtPriceX96, updating the price sets in place.
 
         Args:
-            storage: PostgresStorage instance for database queries
-            all_tokens: Set of all token addresses we care about
-            initial_prices: Dict of token_address -> price (from exchanges + V2 + V3)
+            rows: (pool_address_or_id, token0, token1) tuples, lowercased
+            pool_states: Pool state from UniswapV3DataBatcher/UniswapV4DataBatcher
+            prices: Dict of token_address -> price, updated in place
+            tokens_with_prices: Set of priced tokens, updated in place
+            tokens_without_prices: Set of unpriced tokens, updated in place
             token_decimals: Dict of token_address -> decimals
-            v4_factories: List of V4 factory addresses
-            max_iterations: Maximum number of discovery rounds
+            normalize: Optional token address mapping applied before lookups
+                (V4 passes normalize_token_for_pricing)
 
         Returns:
-            Dict of token_address -> price with all discovered prices
+            Number of new prices found
         """
-        from src.batchers.base import BatchConfig
-        from src.batchers.uniswap_v4_data import UniswapV4DataBatcher
+        new_prices_found = 0
+        for pool_addr, token0, token1 in rows:
+            if normalize is not None:
+                token0 = normalize(token0)
+                token1 = normalize(token1)
 
-        logger.info("🔍 V4 Price Discovery Starting...")
-        logger.info(f"   Starting with {len(initial_prices)} prices")
-
-        # Initialize
-        prices = dict(initial_prices)
-        tokens_with_prices = set(prices.keys())
-        tokens_without_prices = all_tokens - tokens_with_prices
-
-        batch_config = BatchConfig(batch_size=50)
-        v4_batcher = UniswapV4DataBatcher(self.web3, config=batch_config)
-
-        for iteration in range(max_iterations):
-            if not tokens_without_prices:
-                logger.info(f"   ✅ All tokens priced after {iteration} iterations!")
-                break
-
-            # Query V4 pools where one token has price, other doesn't
-            # Note: V4 stores pool_id in the address column
-            # Query BOTH tables to get all V4 pools
-            query = """
-            SELECT DISTINCT
-                address as pool_id,
-                asset0 as token0,
-                asset1 as token1
-            FROM (
-                SELECT address, asset0, asset1, factory FROM network_1__dex_pools
-                UNION
-                SELECT address, asset0, asset1, factory FROM network_1_dex_pools_cryo
-            ) pools
-            WHERE LOWER(factory) = ANY($1)
-            AND (
-                (LOWER(asset0) = ANY($2) AND LOWER(asset1) = ANY($3))
-                OR
-                (LOWER(asset0) = ANY($3) AND LOWER(asset1) = ANY($2))
-            )
-            """
-
-            async with storage.pool.acquire() as conn:
-                results = await conn.fetch(
-                    query,
-                    [f.lower() for f in v4_factories],
-                    [addr.lower() for addr in tokens_without_prices],
-                    [addr.lower() for addr in tokens_with_prices],
-                )
-
-            if not results:
-                break
-
-            # Fetch pool states
-            pool_ids = [row["pool_id"].lower() for row in results]
-            pool_states = await v4_batcher.fetch_pools_chunked(pool_ids)
+            state = pool_states.get(pool_addr)
+            if not state:
+                continue
 
-            # Calculate prices
-            new_prices_found = 0
-            for row in results:
-                pool_id = row["pool_id"].lower()
-                token0 = row["token0"].lower()
-                token1 = row["token1"].lower()
+            try:
+                sqrt_price_x96 = int(state["sqrtPriceX96"])
+                if sqrt_price_x96 == 0:
+                    continue
 
-                # Normalize zero address to WETH for pricing
-                token0_lookup = normalize_token_for_pricing(token0)
-                token1_lookup = normalize_token_for_pricing(token1)
+                decimals0 = token_decimals.get(token0)
+                decimals1 = token_decimals.get(token1)
 
-                state = pool_states.get(pool_id)
-                if not state:
+                if decimals0 is None or decimals1 is None:
                     continue
 
-                try:
-                    sqrt_price_x96 = int(state["sqrtPriceX96"])
-                    if sqrt_price_x96 == 0:
-                        continue
-
-                    # Get decimals (using normalized addresses for zero address)
-                    decimals0 = token_decimals.get(token0_lookup)
-                    decimals1 = token_decimals.get(token1_lookup)
-
-                    if decimals0 is None or decimals1 is None:
-                        continue
-
-                    # Calculate price ratio from sqrtPriceX96
-                    price_ratio = Decimal(sqrt_price_x96**2) / Decimal(2**192)
-                    decimals_adjustment = Decimal(10 ** (decimals0 - decimals1))
-                    price_token0_in_token1 = price_ratio * decimals_adjustment
-
-                    # Determine which token has price and calculate the other
-                    # Use normalized addresses for price lookup
-                    if (
-                        token0_lookup in tokens_with_prices
-                        and token1_lookup in tokens_without_prices
-                    ):
-                        price0 = prices[token0_lookup]
-                        if price_token0_in_token1 > 0:
-                            price1 = price0 / price_token0_in_token1
-                            prices[token1_lookup] = price1
-                            tokens_with_prices.add(token1_lookup)
-                            tokens_without_prices.discard(token1_lookup)
-                            new_prices_found += 1
-
-                    elif (
-                        token1_lookup in tokens_with_prices
-                        and token0_lookup in tokens_without_prices
-                    ):
-                        price1 = prices[token1_lookup]
-                        price0 = price1 * price_token0_in_token1
-                        prices[token0_lookup] = price0
-                        tokens_with_prices.add(token0_lookup)
-                        tokens_without_prices.discard(token0_lookup)
+                # Calculate price ratio from sqrtPriceX96
+                # price = (sqrtPriceX96 / 2^96)^2 * (10^decimals0 / 10^decimals1)
+                price_token0_in_token1 = _sqrt_price_x96_to_float(
+                    sqrt_price_x96, decimals0, decimals1
+                )
+
+                # Determine which token has price and calculate the other
+                if token0 in tokens_with_prices and token1 in tokens_without_prices:
+                    price0 = float(prices[token0])
+                    if price_token0_in_token1 > 0:
+                        price1 = price0 / price_token0_in_token1
+                        prices[token1] = Decimal(repr(price1))
+                        tokens_with_prices.add(token1)
+                        tokens_without_prices.discard(token1)
                         new_prices_found += 1
 
-                except (ValueError, KeyError, ZeroDivisionError, TypeError):
-                    continue
+                elif token1 in tokens_with_prices and token0 in tokens_without_prices:
+                    price1 = float(prices[token1])
+                    price0 = price1 * price_token0_in_token1
+                    prices[token0] = Decimal(repr(price0))
+                    tokens_with_prices.add(token0)
+                    tokens_without_prices.discard(token0)
+                    new_prices_found += 1
 
-            if new_prices_found == 0:
-                break
+            except (ValueError, KeyError, ZeroDivisionError, TypeError):
+                continue
 
-        logger.info(
-            f"   ✅ V4 Discovery: {len(prices) - len(initial_prices)} new prices"
-        )
-        return prices
+        return new_prices_found
 
     def _map_token_to_price_symbol(
         self, token_address: str, token_symbols: Dict[str, str]
@@ -715,15 +837,7 @@ class PoolLiquidityFilter:
         Returns:
             Symbol for price lookup (uppercase)
         """
-        symbol = token_symbols.get(token_address, "").upper()
-
-        # Handle wrapped tokens
-        if symbol == "WETH":
-            return "ETH"
-        elif symbol == "WBTC":
-            return "BTC"
-
-        return symbol
+        return _price_symbol(token_symbols.get(token_address, ""))
 
     def _calculate_token_price_from_pair(
         self,
@@ -756,7 +870,7 @@ class PoolLiquidityFilter:
         price_ratio = Decimal(reserve_other) / Decimal(reserve_token)
 
         # Adjust for decimals
-        decimals_adjustment = Decimal(10) ** (decimals_token - decimals_other)
+        decimals_adjustment = _pow10(decimals_token - decimals_other)
 
         # Calculate final price
         price_token = price_ratio * decimals_adjustment * price_other
@@ -768,7 +882,7 @@ class PoolLiquidityFilter:
         pools: Dict[str, Dict],
         token_symbols: Dict[str, str],
         token_decimals: Dict[str, int],
-        hyperliquid_symbol_prices: Dict[str, Decimal],
+        hyperliquid_symbol_prices: Dict[str, float],
     ) -> Tuple[Dict[str, Dict], Dict[str, Decimal]]:
         """
         Filter Uniswap V2 pools by minimum liquidity.
@@ -789,14 +903,15 @@ class PoolLiquidityFilter:
         logger.info(f"🔍 Filtering {len(pools)} V2 pools by liquidity...")
 
         # Initialize prices from Hyperliquid, mapping to token addresses
-        token_prices = {}
-        for token_addr, symbol in token_symbols.items():
-            symbol_upper = self._map_token_to_price_symbol(token_addr, token_symbols)
-            if symbol_upper in hyperliquid_symbol_prices:
-                token_prices[token_addr] = hyperliquid_symbol_prices[symbol_upper]
-                logger.debug(
-                    f"  Mapped {symbol} ({token_addr[:10]}...) -> ${token_prices[token_addr]}"
-                )
+        price_symbols = {
+            token_addr: _price_symbol(symbol)
+            for token_addr, symbol in token_symbols.items()
+        }
+        token_prices = {
+            token_addr: Decimal(repr(hyperliquid_symbol_prices[price_symbol]))
+            for token_addr, price_symbol in price_symbols.items()
+            if price_symbol in hyperliquid_symbol_prices
+        }
 
         initial_price_count = len(token_prices)
         logger.info(
@@ -804,7 +919,7 @@ class PoolLiquidityFilter:
         )
 
         # Batch fetch reserves for all pools
-        pool_addresses = list(pools.keys())
+        pool_addresses = [pool_addr.lower() for pool_addr in pools]
         batcher = UniswapV2ReservesBatcher(self.web3)
 
         try:
@@ -818,23 +933,24 @@ class PoolLiquidityFilter:
         filtered_pools = {}
         pools_below_threshold = 0
 
-        for pool_addr, pool_data in pools.items():
+        # Skip building per-item debug messages unless DEBUG is on
+        debug = logger.isEnabledFor(logging.DEBUG)
+
+        for pool_addr_lower, (pool_addr, pool_data) in zip(
+            pool_addresses, pools.items()
+        ):
             # Get reserves
-            reserves = reserves_data.get(pool_addr.lower())
+            reserves = reserves_data.get(pool_addr_lower)
             if not reserves:
-                logger.debug(f"  No reserves data for {pool_addr[:10]}...")
+                if debug:
+                    logger.debug(f"  No reserves data for {pool_addr[:10]}...")
                 continue
 
             token0_addr = pool_data["token0"]["address"]
             token1_addr = pool_data["token1"]["address"]
 
-            # Parse reserves as integers
-            try:
-                reserve0 = int(reserves["reserve0"], 16)
-                reserve1 = int(reserves["reserve1"], 16)
-            except (ValueError, TypeError) as e:
-                logger.debug(f"  Invalid reserves for {pool_addr[:10]}...: {e}")
-                continue
+            reserve0 = reserves["reserve0"]
+            reserve1 = reserves["reserve1"]
 
             if reserve0 == 0 or reserve1 == 0:
                 continue
@@ -844,9 +960,10 @@ class PoolLiquidityFilter:
             decimals1 = token_decimals.get(token1_addr)
 
             if decimals0 is None or decimals1 is None:
-                logger.debug(
-                    f"  Missing decimals for V2 pool (token0={decimals0}, token1={decimals1})"
-                )
+                if debug:
+                    logger.debug(
+                        f"  Missing decimals for V2 pool (token0={decimals0}, token1={decimals1})"
+                    )
                 continue
 
             # Get or calculate prices
@@ -863,30 +980,33 @@ class PoolLiquidityFilter:
                     reserve0, reserve1, decimals0, decimals1, price1
                 )
                 token_prices[token0_addr] = price0
-                logger.debug(
-                    f"  Calculated price for {token_symbols.get(token0_addr, token0_addr[:8])}: ${price0}"
-                )
+                if debug:
+                    logger.debug(
+                        f"  Calculated price for {token_symbols.get(token0_addr, token0_addr[:8])}: ${price0}"
+                    )
 
             elif price1 is None and price0 is not None:
                 price1 = self._calculate_token_price_from_pair(
                     reserve1, reserve0, decimals1, decimals0, price0
                 )
                 token_prices[token1_addr] = price1
-                logger.debug(
-                    f"  Calculated price for {token_symbols.get(token1_addr, token1_addr[:8])}: ${price1}"
-                )
+                if debug:
+                    logger.debug(
+                        f"  Calculated price for {token_symbols.get(token1_addr, token1_addr[:8])}: ${price1}"
+                    )
 
-            # Calculate liquidity in USD
-            liquidity0_usd = (Decimal(reserve0) / Decimal(10**decimals0)) * price0
-            liquidity1_usd = (Decimal(reserve1) / Decimal(10**decimals1)) * price1
+            # Calculate liquidity in USD (float is plenty for a threshold check)
+            liquidity0_usd = reserve0 / _POW10_FLOAT[decimals0] * float(price0)
+            liquidity1_usd = reserve1 / _POW10_FLOAT[decimals1] * float(price1)
             total_liquidity_usd = liquidity0_usd + liquidity1_usd
 
             # Filter by minimum liquidity (using V2-specific threshold)
             if total_liquidity_usd >= self.min_liquidity_v2_usd:
                 filtered_pools[pool_addr] = pool_data
-                logger.debug(
-                    f"  ✓ {pool_addr[:10]}... - ${total_liquidity_usd:,.2f} liquidity"
-                )
+                if debug:
+                    logger.debug(
+                        f"  ✓ {pool_addr[:10]}... - ${total_liquidity_usd:,.2f} liquidity"
+                    )
             else:
                 pools_below_threshold += 1
 
@@ -928,7 +1048,7 @@ class PoolLiquidityFilter:
         logger.info(f"🔍 Filtering {len(pools)} V3 pools by liquidity...")
 
         # Batch fetch pool state (sqrtPriceX96, liquidity, tick)
-        pool_addresses = list(pools.keys())
+        pool_addresses = [pool_addr.lower() for pool_addr in pools]
         # Use smaller batch size to minimize impact of failed pools
         from src.batchers.base import BatchConfig
 
@@ -956,41 +1076,33 @@ class PoolLiquidityFilter:
             f"  📍 Starting with {len(updated_prices)} token prices from V2 + Hyperliquid"
         )
 
-        for pool_addr, pool_data in pools.items():
+        # Skip building per-item debug messages unless DEBUG is on
+        debug = logger.isEnabledFor(logging.DEBUG)
+
+        for pool_addr_lower, (pool_addr, pool_data) in zip(
+            pool_addresses, pools.items()
+        ):
             # Get pool state
-            state = pool_states.get(pool_addr.lower())
+            state = pool_states.get(pool_addr_lower)
             if not state:
                 pools_no_state += 1
-                logger.debug(f"  No state data for {pool_addr[:10]}...")
+                if debug:
+                    logger.debug(f"  No state data for {pool_addr[:10]}...")
                 continue
 
             token0_addr = pool_data["token0"]["address"]
             token1_addr = pool_data["token1"]["address"]
 
-            # Get pool parameters
-            try:
-                sqrt_price_x96 = int(state["sqrtPriceX96"])
-                liquidity = int(state["liquidity"])
-                tick = int(state["tick"])
-            except (ValueError, TypeError, KeyError) as e:
-                logger.debug(f"  Invalid pool state for {pool_addr[:10]}...: {e}")
-                pools_calc_error += 1
-                continue
-
-            # Skip pools with no liquidity
-            if liquidity == 0:
-                pools_no_liquidity += 1
-                continue
-
             # Get decimals - skip if we don't have this info
             decimals0 = token_decimals.get(token0_addr)
             decimals1 = token_decimals.get(token1_addr)
 
             if decimals0 is None or decimals1 is None:
                 pools_no_decimals += 1
-                logger.debug(
-                    f"  Missing decimals for pool (token0={decimals0}, token1={decimals1})"
-                )
+                if debug:
+                    logger.debug(
+                        f"  Missing decimals for pool (token0={decimals0}, token1={decimals1})"
+                    )
                 continue
 
             # Get prices
@@ -1000,9 +1112,26 @@ class PoolLiquidityFilter:
             # Skip if we have neither price
             if price0 is None and price1 is None:
                 pools_no_prices += 1
-                symbol0 = token_symbols.get(token0_addr, token0_addr[:8])
-                symbol1 = token_symbols.get(token1_addr, token1_addr[:8])
-                logger.debug(f"  No prices for {symbol0}/{symbol1} pool")
+                if debug:
+                    symbol0 = token_symbols.get(token0_addr, token0_addr[:8])
+                    symbol1 = token_symbols.get(token1_addr, token1_addr[:8])
+                    logger.debug(f"  No prices for {symbol0}/{symbol1} pool")
+                continue
+
+            # Only parse the big integers for pools that survived the cheap lookups
+            try:
+                sqrt_price_x96 = int(state["sqrtPriceX96"])
+                liquidity = int(state["liquidity"])
+                tick = int(state["tick"])
+            except (ValueError, TypeError, KeyError) as e:
+                if debug:
+                    logger.debug(f"  Invalid pool state for {pool_addr[:10]}...: {e}")
+                pools_calc_error += 1
+                continue
+
+            # Skip pools with no liquidity
+            if liquidity == 0:
+                pools_no_liquidity += 1
                 continue
 
             # Calculate token amounts at current price
@@ -1030,54 +1159,64 @@ class PoolLiquidityFilter:
                 )
 
             except Exception as e:
-                logger.debug(
-                    f"  Failed to calculate amounts for {pool_addr[:10]}...: {e}"
-                )
+                if debug:
+                    logger.debug(
+                        f"  Failed to calculate amounts for {pool_addr[:10]}...: {e}"
+                    )
                 continue
 
-            # Convert amounts to decimal format
-            amount0_decimal = Decimal(amount0) / Decimal(10**decimals0)
-            amount1_decimal = Decimal(amount1) / Decimal(10**decimals1)
-
             # Calculate or derive prices if one is missing
             if price0 is None and price1 is not None:
                 # Calculate price0 from the ratio: price0 = (amount1 / amount0) * price1
                 if amount0 > 0:
-                    price0 = (amount1_decimal / amount0_decimal) * price1
-                    updated_prices[token0_addr] = price0
-                    logger.debug(
-                        f"  Calculated price for {token_symbols.get(token0_addr, token0_addr[:8])}: ${price0}"
+                    price0 = (
+                        Decimal(amount1)
+                        / Decimal(amount0)
+                        * _pow10(decimals0 - decimals1)
+                        * price1
                     )
+                    updated_prices[token0_addr] = price0
+                    if debug:
+                        logger.debug(
+                            f"  Calculated price for {token_symbols.get(token0_addr, token0_addr[:8])}: ${price0}"
+                        )
                 else:
                     continue
 
             elif price1 is None and price0 is not None:
                 # Calculate price1 from the ratio: price1 = (amount0 / amount1) * price0
                 if amount1 > 0:
-                    price1 = (amount0_decimal / amount1_decimal) * price0
-                    updated_prices[token1_addr] = price1
-                    logger.debug(
-                        f"  Calculated price for {token_symbols.get(token1_addr, token1_addr[:8])}: ${price1}"
+                    price1 = (
+                        Decimal(amount0)
+                        / Decimal(amount1)
+                        * _pow10(decimals1 - decimals0)
+                        * price0
                     )
+                    updated_prices[token1_addr] = price1
+                    if debug:
+                        logger.debug(
+                            f"  Calculated price for {token_symbols.get(token1_addr, token1_addr[:8])}: ${price1}"
+                        )
                 else:
                     continue
 
-            # Calculate liquidity in USD
-            liquidity0_usd = amount0_decimal * price0
-            liquidity1_usd = amount1_decimal * price1
+            # Calculate liquidity in USD (float is plenty for a threshold check)
+            liquidity0_usd = amount0 / _POW10_FLOAT[decimals0] * float(price0)
+            liquidity1_usd = amount1 / _POW10_FLOAT[decimals1] * float(price1)
             total_liquidity_usd = liquidity0_usd + liquidity1_usd
 
             # Filter by minimum liquidity
-            if total_liquidity_usd >= self.min_liquidity_usd:
+            if total_liquidity_usd >= self.min_liquidity_v3_usd:
                 filtered_pools[pool_addr] = pool_data
-                logger.debug(
-                    f"  ✓ {pool_addr[:10]}... - ${total_liquidity_usd:,.2f} liquidity"
-                )
+                if debug:
+                    logger.debug(
+                        f"  ✓ {pool_addr[:10]}... - ${total_liquidity_usd:,.2f} liquidity"
+                    )
             else:
                 pools_below_threshold += 1
 
         logger.info(
-            f"  ✅ {len(filtered_pools)} V3 pools above ${self.min_liquidity_usd:,.0f} threshold"
+            f"  ✅ {len(filtered_pools)} V3 pools above ${self.min_liquidity_v3_usd:,.0f} threshold"
         )
         logger.info(f"  ❌ {pools_below_threshold} V3 pools below threshold")
         logger.info(f"  📊 V3 Filtering breakdown:")
@@ -1143,45 +1282,56 @@ class PoolLiquidityFilter:
         pools_calc_error = 0
         updated_prices = dict(token_prices)
 
-        for pool_id, pool_data in pools.items():
-            # Get pool state
-            state = pool_states.get(pool_id.lower())
-            if not state:
-                pools_no_state += 1
-                logger.debug(f"  No state data for pool {pool_id[:10]}...")
-                continue
-
-            token0_addr = pool_data["token0"]["address"]
-            token1_addr = pool_data["token1"]["address"]
+        # Resolve token lookups and decimals once up front; these don't depend
+        # on pool state, so the loop below only has to unpack a tuple
+        pool_metadata = []
+        # Skip building per-item debug messages unless DEBUG is on
+        debug = logger.isEnabledFor(logging.DEBUG)
 
+        for pool_id, pool_data in pools.items():
             # Normalize addresses for price/decimal lookup (zero address -> WETH)
-            token0_lookup = normalize_token_for_pricing(token0_addr)
-            token1_lookup = normalize_token_for_pricing(token1_addr)
-
-            # Get pool parameters
-            try:
-                sqrt_price_x96 = int(state["sqrtPriceX96"])
-                liquidity = int(state["liquidity"])
-                tick = int(state["tick"])
-            except (ValueError, TypeError, KeyError) as e:
-                logger.debug(f"  Invalid pool state for {pool_id[:10]}...: {e}")
-                continue
-
-            # Skip pools with no liquidity
-            if liquidity == 0:
-                pools_zero_liquidity += 1
-                continue
+            token0_lookup = normalize_token_for_pricing(pool_data["token0"]["address"])
+            token1_lookup = normalize_token_for_pricing(pool_data["token1"]["address"])
 
             # Get decimals - skip if we don't have this info
-            # Use normalized addresses for lookup (treats native ETH as WETH)
             decimals0 = token_decimals.get(token0_lookup)
             decimals1 = token_decimals.get(token1_lookup)
 
             if decimals0 is None or decimals1 is None:
                 pools_no_decimals += 1
-                logger.debug(
-                    f"  Missing decimals for pool (token0={decimals0}, token1={decimals1})"
+                if debug:
+                    logger.debug(
+                        f"  Missing decimals for pool (token0={decimals0}, token1={decimals1})"
+                    )
+                continue
+
+            pool_metadata.append(
+                (
+                    pool_id,
+                    pool_data,
+                    pool_id.lower(),
+                    token0_lookup,
+                    token1_lookup,
+                    decimals0,
+                    decimals1,
                 )
+            )
+
+        for (
+            pool_id,
+            pool_data,
+            pool_id_lower,
+            token0_lookup,
+            token1_lookup,
+            decimals0,
+            decimals1,
+        ) in pool_metadata:
+            # Get pool state
+            state = pool_states.get(pool_id_lower)
+            if not state:
+                pools_no_state += 1
+                if debug:
+                    logger.debug(f"  No state data for pool {pool_id[:10]}...")
                 continue
 
             # Get prices - use normalized addresses for lookup
@@ -1193,9 +1343,39 @@ class PoolLiquidityFilter:
                 pools_no_prices += 1
                 continue
 
+            # Only parse the big integers for pools that survived the cheap lookups
+            try:
+                sqrt_price_x96 = int(state["sqrtPriceX96"])
+                liquidity = int(state["liquidity"])
+                tick = int(state["tick"])
+            except (ValueError, TypeError, KeyError) as e:
+                if debug:
+                    logger.debug(f"  Invalid pool state for {pool_id[:10]}...: {e}")
+                continue
+
+            # Skip pools with no liquidity
+            if liquidity == 0:
+                pools_zero_liquidity += 1
+                continue
+
             # Calculate token amounts at current price
             # For V4 (like V3), we calculate amounts in a range around current tick
             # Using tick +/- 100 (~1% price movement) as proxy for "active" liquidity
+            if price0 is not None and price1 is not None:
+                # Fast path: nothing to infer, so skip the bigint amount math
+                per_liquidity0, per_liquidity1 = _active_range_amounts_per_liquidity(
+                    tick
+                )
+                total_liquidity_usd = liquidity * (
+                    per_liquidity0 / _POW10_FLOAT[decimals0] * float(price0)
+                    + per_liquidity1 / _POW10_FLOAT[decimals1] * float(price1)
+                )
+                if total_liquidity_usd >= self.min_liquidity_v4_usd:
+                    filtered_pools[pool_id] = pool_data
+                else:
+                    pools_below_threshold += 1
+                continue
+
             try:
                 tick_lower = tick - 100
                 tick_upper = tick + 100
@@ -1205,59 +1385,68 @@ class PoolLiquidityFilter:
 
                 # Calculate token amounts
                 amount0 = get_amount0_delta(
-                    sqrt_ratio_a, sqrt_ratio_b, liquidity, roundUp=False
+                    sqrt_ratio_a_x96=sqrt_ratio_a,
+                    sqrt_ratio_b_x96=sqrt_ratio_b,
+                    liquidity=liquidity,
+                    round_up=False,
                 )
                 amount1 = get_amount1_delta(
-                    sqrt_ratio_a, sqrt_ratio_b, liquidity, roundUp=False
+                    sqrt_ratio_a_x96=sqrt_ratio_a,
+                    sqrt_ratio_b_x96=sqrt_ratio_b,
+                    liquidity=liquidity,
+                    round_up=False,
                 )
 
-                # Convert to human-readable amounts
-                amount0_decimal = Decimal(abs(amount0)) / Decimal(10**decimals0)
-                amount1_decimal = Decimal(abs(amount1)) / Decimal(10**decimals1)
+                # Convert to human-readable amounts (float is plenty for a
+                # threshold check; inferred prices below stay Decimal). The
+                # deltas order their bounds, so amounts are never negative.
+                amount0_float = amount0 / _POW10_FLOAT[decimals0]
+                amount1_float = amount1 / _POW10_FLOAT[decimals1]
 
                 # Calculate USD value
-                value0_usd = amount0_decimal * price0 if price0 else Decimal(0)
-                value1_usd = amount1_decimal * price1 if price1 else Decimal(0)
+                value0_usd = amount0_float * float(price0) if price0 else 0.0
+                value1_usd = amount1_float * float(price1) if price1 else 0.0
                 total_liquidity_usd = value0_usd + value1_usd
 
                 # If we only have one price, try to infer the other
-                if price0 and not price1 and amount1_decimal > 0:
+                if price0 and not price1 and amount1_float > 0:
                     # Calculate implied price from pool ratio
-                    price_ratio = Decimal(sqrt_price_x96**2) / Decimal(2**192)
+                    price_ratio = Decimal(sqrt_price_x96 * sqrt_price_x96) / _Q192
                     implied_price1 = price0 / price_ratio if price_ratio > 0 else None
                     if implied_price1:
-                        value1_usd = amount1_decimal * implied_price1
+                        value1_usd = amount1_float * float(implied_price1)
                         total_liquidity_usd = value0_usd + value1_usd
                         # Store with normalized address (zero address stored as WETH)
                         updated_prices[token1_lookup] = implied_price1
 
-                elif price1 and not price0 and amount0_decimal > 0:
+                elif price1 and not price0 and amount0_float > 0:
                     # Calculate implied price from pool ratio
-                    price_ratio = Decimal(sqrt_price_x96**2) / Decimal(2**192)
+                    price_ratio = Decimal(sqrt_price_x96 * sqrt_price_x96) / _Q192
                     implied_price0 = price1 * price_ratio
                     if implied_price0:
-                        value0_usd = amount0_decimal * implied_price0
+                        value0_usd = amount0_float * float(implied_price0)
                         total_liquidity_usd = value0_usd + value1_usd
                         # Store with normalized address (zero address stored as WETH)
                         updated_prices[token0_lookup] = implied_price0
 
                 # Filter by minimum liquidity
-                if total_liquidity_usd >= self.min_liquidity_usd:
+                if total_liquidity_usd >= self.min_liquidity_v4_usd:
                     filtered_pools[pool_id] = pool_data
                 else:
                     pools_below_threshold += 1
 
             except Exception as e:
                 pools_calc_error += 1
-                logger.debug(
-                    f"  Error calculating liquidity for {pool_id[:10]}...: {e}"
-                )
+                if debug:
+                    logger.debug(
+                        f"  Error calculating liquidity for {pool_id[:10]}...: {e}"
+                    )
                 continue
 
         # Log summary
         logger.info(f"  ✅ Filtered {len(filtered_pools)} V4 pools")
         logger.info(
-            f"     {pools_below_threshold} pools below ${self.min_liquidity_usd} threshold"
+            f"     {pools_below_threshold} pools below ${self.min_liquidity_v4_usd:,.0f} threshold"
         )
 
         # Log reasons for filtering
@@ -1346,7 +1535,7 @@ class PoolLiquidityFilter:
 
         This method:
         1. Fetches exchange prices (Hyperliquid + Binance)
-        2. Discovers prices through V2/V3/V4 pools iteratively
+        2. Discovers prices through V2/V3/V4 pools iteratively (one query per round)
         3. Filters pools by minimum liquidity threshold
 
         Args:
@@ -1357,7 +1546,7 @@ class PoolLiquidityFilter:
             v2_factories: List of V2 factory addresses
             v3_factories: List of V3 factory addresses
             v4_factories: List of V4 factory addresses
-            pools: Dict of pool_address -> pool_data (all protocols combined)
+            pools: Dict of lowercase pool_address -> pool_data (all protocols combined)
 
         Returns:
             Dict with filtered pools and discovered prices
@@ -1368,84 +1557,82 @@ class PoolLiquidityFilter:
 
         # Step 1: Fetch exchange prices
         logger.info("\n📊 Step 1: Fetching exchange prices...")
-        hyperliquid_prices = await self.fetch_hyperliquid_prices()
-        binance_prices = await self.fetch_binance_prices()
+        # The two exchanges are independent, so fetch them concurrently
+        hyperliquid_prices, binance_prices = await asyncio.gather(
+            self.fetch_hyperliquid_prices(), self.fetch_binance_prices()
+        )
 
-        # Map exchange prices to token addresses
+        # One symbol -> price table: Binance wins over Hyperliquid, and wrapped
+        # aliases (WETH/WBTC) resolve to the underlying asset's quote first
+        exchange_prices = dict(hyperliquid_prices)
+        exchange_prices.update(binance_prices)
+        for alias, underlying in PRICE_SYMBOL_ALIASES.items():
+            for source in (binance_prices, hyperliquid_prices):
+                price = source.get(underlying, source.get(alias))
+                if price is not None:
+                    exchange_prices[alias] = price
+                    break
+
+        # Map exchange prices to token addresses. Exchange quotes stay float
+        # until here; pool math downstream is Decimal
         initial_prices = {}
         for token_addr, symbol in token_symbols.items():
-            symbol_upper = symbol.upper()
-            exchange_symbol = (
-                "ETH"
-                if symbol_upper == "WETH"
-                else "BTC"
-                if symbol_upper == "WBTC"
-                else symbol_upper
-            )
-
-            if exchange_symbol in binance_prices:
-                initial_prices[token_addr] = binance_prices[exchange_symbol]
-            elif symbol_upper in binance_prices:
-                initial_prices[token_addr] = binance_prices[symbol_upper]
-            elif exchange_symbol in hyperliquid_prices:
-                initial_prices[token_addr] = hyperliquid_prices[exchange_symbol]
-            elif symbol_upper in hyperliquid_prices:
-                initial_prices[token_addr] = hyperliquid_prices[symbol_upper]
+            price = exchange_prices.get(symbol.upper())
+            if price is not None:
+                initial_prices[token_addr] = Decimal(repr(price))
 
         logger.info(f"   ✅ Mapped {len(initial_prices)} exchange prices")
 
-        # Step 2: V2 Price Discovery
-        logger.info("\n🔍 Step 2: V2 Price Discovery...")
-        prices_after_v2 = await self.discover_prices_from_v2_pools(
-            storage=storage,
-            all_tokens=all_tokens,
-            initial_prices=initial_prices,
-            token_decimals=token_decimals,
-            v2_factories=v2_factories,
-            max_iterations=10,
-        )
-        logger.info(f"   ✅ Total prices after V2: {len(prices_after_v2)}")
+        # Seed discovery with recent pool prices; live exchange prices win
+        cached_entries = self._load_discovered_price_cache()
+        cached_prices = {addr: price for addr, (price, _) in cached_entries.items()}
+        seed_prices = {**cached_prices, **initial_prices}
+        if cached_prices:
+            logger.info(
+                f"   ♻️  Seeded {len(seed_prices) - len(initial_prices)} prices from disk cache"
+            )
 
-        # Step 3: V3 Price Discovery
-        logger.info("\n🔍 Step 3: V3 Price Discovery...")
-        prices_after_v3 = await self.discover_prices_from_v3_pools(
+        # Step 2: Price discovery through V2/V3/V4 pools, one query per round
+        logger.info("\n🔍 Step 2: V2/V3/V4 Price Discovery...")
+        # Reserves/state fetched for discovery are reused by the RPC filter path
+        discovery_states: Dict[str, Dict[str, Dict]] = {"v2": {}, "v3": {}, "v4": {}}
+        final_prices = await self.discover_prices_from_all_pools(
             storage=storage,
             all_tokens=all_tokens,
-            initial_prices=prices_after_v2,
+            initial_prices=seed_prices,
             token_decimals=token_decimals,
+            v2_factories=v2_factories,
             v3_factories=v3_factories,
-            max_iterations=10,
-        )
-        logger.info(f"   ✅ Total prices after V3: {len(prices_after_v3)}")
-
-        # Step 4: V4 Price Discovery
-        logger.info("\n🔍 Step 4: V4 Price Discovery...")
-        final_prices = await self.discover_prices_from_v4_pools(
-            storage=storage,
-            all_tokens=all_tokens,
-            initial_prices=prices_after_v3,
-            token_decimals=token_decimals,
             v4_factories=v4_factories,
             max_iterations=10,
+            fetched_states=discovery_states,
+        )
+        logger.info(f"   ✅ Total prices after discovery: {len(final_prices)}")
+
+        # Only prices found on pools this run are stamped now; cached entries
+        # keep their original time so they still expire, and exchange prices
+        # are fetched fresh every run anyway
+        discovered_at = time.time()
+        cached_entries.update(
+            (addr, (price, discovered_at))
+            for addr, price in final_prices.items()
+            if addr not in seed_prices
         )
-        logger.info(f"   ✅ Total prices after V4: {len(final_prices)}")
+        self._save_discovered_price_cache(cached_entries)
 
         # Store prices in self for filtering
         self.prices = final_prices
 
-        # Step 5: Filter pools by liquidity (batched by protocol)
-        logger.info(f"\n💰 Step 5: Filtering {len(pools)} pools by liquidity...")
+        # Step 3: Filter pools by liquidity (batched by protocol)
+        logger.info(f"\n💰 Step 3: Filtering {len(pools)} pools by liquidity...")
 
-        # Separate pools by protocol
-        v2_pools = {
-            addr: data for addr, data in pools.items() if data.get("protocol") == "v2"
-        }
-        v3_pools = {
-            addr: data for addr, data in pools.items() if data.get("protocol") == "v3"
-        }
-        v4_pools = {
-            addr: data for addr, data in pools.items() if data.get("protocol") == "v4"
-        }
+        # Separate pools by protocol in a single pass
+        v2_pools, v3_pools, v4_pools = {}, {}, {}
+        pools_by_protocol = {"v2": v2_pools, "v3": v3_pools, "v4": v4_pools}
+        for addr, data in pools.items():
+            protocol_pools = pools_by_protocol.get(data.get("protocol"))
+            if protocol_pools is not None:
+                protocol_pools[addr] = data
 
         logger.info(
             f"   V2: {len(v2_pools)}, V3: {len(v3_pools)}, V4: {len(v4_pools)} pools"
@@ -1454,113 +1641,138 @@ class PoolLiquidityFilter:
         filtered_pools = {}
         pools_below_threshold = 0
 
-        # Batch fetch V2 reserves
-        if v2_pools:
+        # The three protocols hit independent contracts, so fetch their state
+        # concurrently and only run the per-pool filtering sequentially
+        async def fetch_v2_reserves() -> Dict[str, Dict]:
+            if not v2_pools:
+                return {}
             logger.info(f"   Fetching reserves for {len(v2_pools)} V2 pools...")
 
             # Try Reth DB first, fallback to RPC
             if self.reth_loader:
                 logger.info("   Using Reth DB for V2 reserves (direct access)")
-                v2_reserves = self._fetch_v2_reserves_from_reth(list(v2_pools.keys()))
-            else:
-                logger.info("   Using RPC for V2 reserves (fallback)")
-                v2_batcher = UniswapV2ReservesBatcher(self.web3)
-                v2_reserves = await v2_batcher.fetch_reserves_chunked(
-                    list(v2_pools.keys())
-                )
-
-            for pool_addr, pool_data in v2_pools.items():
-                reserves = v2_reserves.get(pool_addr.lower())
-                if not reserves:
-                    pools_below_threshold += 1
-                    continue
-
-                liquidity_usd = self._calculate_v2_liquidity_from_reserves(
-                    pool_data, reserves, final_prices, token_decimals
-                )
+                return self._fetch_v2_reserves_from_reth(list(v2_pools.keys()))
 
-                if (
-                    liquidity_usd is not None
-                    and liquidity_usd >= self.min_liquidity_v2_usd
-                ):
-                    pool_data["liquidity_usd"] = liquidity_usd
-                    filtered_pools[pool_addr] = pool_data
-                else:
-                    pools_below_threshold += 1
+            logger.info("   Using RPC for V2 reserves (fallback)")
+            v2_reserves = discovery_states["v2"]
+            missing = [addr for addr in v2_pools if addr not in v2_reserves]
+            logger.info(
+                f"   Reusing {len(v2_pools) - len(missing)} reserves from discovery"
+            )
+            if missing:
+                v2_batcher = UniswapV2ReservesBatcher(self.web3)
+                v2_reserves.update(await v2_batcher.fetch_reserves_chunked(missing))
+            return v2_reserves
 
-        # Batch fetch V3 state
-        if v3_pools:
+        async def fetch_v3_states() -> Dict[str, Dict]:
+            if not v3_pools:
+                return {}
             logger.info(f"   Fetching state for {len(v3_pools)} V3 pools...")
 
             # Try Reth DB first, fallback to RPC
             if self.reth_loader:
                 logger.info("   Using Reth DB for V3 tick data (direct access)")
-                v3_states = self._fetch_v3_states_from_reth(v3_pools)
-            else:
-                logger.info("   Using RPC for V3 state (fallback)")
-                from src.batchers.base import BatchConfig
-                from src.batchers.uniswap_v3_data import UniswapV3DataBatcher
+                return self._fetch_v3_states_from_reth(v3_pools)
+
+            logger.info("   Using RPC for V3 state (fallback)")
+            from src.batchers.base import BatchConfig
+            from src.batchers.uniswap_v3_data import UniswapV3DataBatcher
 
+            v3_states = discovery_states["v3"]
+            missing = [addr for addr in v3_pools if addr not in v3_states]
+            logger.info(
+                f"   Reusing {len(v3_pools) - len(missing)} states from discovery"
+            )
+            if missing:
                 v3_batcher = UniswapV3DataBatcher(
                     self.web3, config=BatchConfig(batch_size=50)
                 )
-                v3_states = await v3_batcher.fetch_pools_chunked(list(v3_pools.keys()))
-
-            for pool_addr, pool_data in v3_pools.items():
-                state = v3_states.get(pool_addr.lower())
-                if not state or "liquidity" not in state:
-                    pools_below_threshold += 1
-                    continue
-
-                liquidity_usd = self._calculate_v3_v4_liquidity_from_state(
-                    pool_data, state, final_prices, token_decimals
-                )
+                v3_states.update(await v3_batcher.fetch_pools_chunked(missing))
+            return v3_states
 
-                if (
-                    liquidity_usd is not None
-                    and liquidity_usd >= self.min_liquidity_v3_usd
-                ):
-                    pool_data["liquidity_usd"] = liquidity_usd
-                    filtered_pools[pool_addr] = pool_data
-                else:
-                    pools_below_threshold += 1
-
-        # Batch fetch V4 state
-        if v4_pools:
+        async def fetch_v4_states() -> Dict[str, Dict]:
+            if not v4_pools:
+                return {}
             logger.info(f"   Fetching state for {len(v4_pools)} V4 pools...")
 
             # Try Reth DB first, fallback to RPC
             if self.reth_loader:
                 logger.info("   Using Reth DB for V4 tick data (direct access)")
-                v4_states = self._fetch_v4_states_from_reth(v4_pools)
-            else:
-                logger.info("   Using RPC for V4 state (fallback)")
-                from src.batchers.base import BatchConfig
-                from src.batchers.uniswap_v4_data import UniswapV4DataBatcher
+                return self._fetch_v4_states_from_reth(v4_pools)
+
+            logger.info("   Using RPC for V4 state (fallback)")
+            from src.batchers.base import BatchConfig
+            from src.batchers.uniswap_v4_data import UniswapV4DataBatcher
 
+            v4_states = discovery_states["v4"]
+            missing = [addr for addr in v4_pools if addr not in v4_states]
+            logger.info(
+                f"   Reusing {len(v4_pools) - len(missing)} states from discovery"
+            )
+            if missing:
                 v4_batcher = UniswapV4DataBatcher(
                     self.web3, config=BatchConfig(batch_size=50)
                 )
-                v4_states = await v4_batcher.fetch_pools_chunked(list(v4_pools.keys()))
+                v4_states.update(await v4_batcher.fetch_pools_chunked(missing))
+            return v4_states
 
-            for pool_addr, pool_data in v4_pools.items():
-                state = v4_states.get(pool_addr.lower())
-                if not state or "liquidity" not in state:
-                    pools_below_threshold += 1
-                    continue
+        v2_reserves, v3_states, v4_states = await asyncio.gather(
+            fetch_v2_reserves(), fetch_v3_states(), fetch_v4_states()
+        )
 
-                liquidity_usd = self._calculate_v3_v4_liquidity_from_state(
-                    pool_data, state, final_prices, token_decimals
-                )
+        for pool_addr, pool_data in v2_pools.items():
+            reserves = v2_reserves.get(pool_addr)
+            if not reserves:
+                pools_below_threshold += 1
+                continue
 
-                if (
-                    liquidity_usd is not None
-                    and liquidity_usd >= self.min_liquidity_v4_usd
-                ):
-                    pool_data["liquidity_usd"] = liquidity_usd
-                    filtered_pools[pool_addr] = pool_data
-                else:
-                    pools_below_threshold += 1
+            liquidity_usd = self._calculate_v2_liquidity_from_reserves(
+                pool_data, reserves, final_prices, token_decimals
+            )
+
+            if liquidity_usd is not None and liquidity_usd >= self.min_liquidity_v2_usd:
+                pool_data["liquidity_usd"] = liquidity_usd
+                filtered_pools[pool_addr] = pool_data
+            else:
+                pools_below_threshold += 1
+
+        # V3/V4 TVL is a float estimate; convert each token's price once
+        # rather than once per pool it appears in
+        float_prices = {addr: float(price) for addr, price in final_prices.items()}
+
+        for pool_addr, pool_data in v3_pools.items():
+            state = v3_states.get(pool_addr)
+            if not state or "liquidity" not in state:
+                pools_below_threshold += 1
+                continue
+
+            liquidity_usd = self._calculate_v3_v4_liquidity_from_state(
+                state,
+                self._resolve_pool_tokens(pool_data, float_prices, token_decimals),
+            )
+
+            if liquidity_usd is not None and liquidity_usd >= self.min_liquidity_v3_usd:
+                pool_data["liquidity_usd"] = liquidity_usd
+                filtered_pools[pool_addr] = pool_data
+            else:
+                pools_below_threshold += 1
+
+        for pool_addr, pool_data in v4_pools.items():
+            state = v4_states.get(pool_addr)
+            if not state or "liquidity" not in state:
+                pools_below_threshold += 1
+                continue
+
+            liquidity_usd = self._calculate_v3_v4_liquidity_from_state(
+                state,
+                self._resolve_pool_tokens(pool_data, float_prices, token_decimals),
+            )
+
+            if liquidity_usd is not None and liquidity_usd >= self.min_liquidity_v4_usd:
+                pool_data["liquidity_usd"] = liquidity_usd
+                filtered_pools[pool_addr] = pool_data
+            else:
+                pools_below_threshold += 1
 
         logger.info(f"   ✅ Filtered to {len(filtered_pools)} pools above threshold")
         logger.info(f"   ❌ Excluded {pools_below_threshold} pools below threshold")
@@ -1607,15 +1819,14 @@ class PoolLiquidityFilter:
         if not price0 and not price1:
             return None
 
-        # Parse reserves
-        reserve0 = Decimal(str(int(reserves["reserve0"], 16)))
-        reserve1 = Decimal(str(int(reserves["reserve1"], 16)))
+        reserve0 = Decimal(reserves["reserve0"])
+        reserve1 = Decimal(reserves["reserve1"])
         decimals0 = token_decimals.get(token0_addr, 18)
         decimals1 = token_decimals.get(token1_addr, 18)
 
         # Adjust for decimals
-        adj_reserve0 = reserve0 / Decimal(10**decimals0)
-        adj_reserve1 = reserve1 / Decimal(10**decimals1)
+        adj_reserve0 = reserve0 / _POW10[decimals0]
+        adj_reserve1 = reserve1 / _POW10[decimals1]
 
         # Calculate total liquidity
         liquidity_usd = Decimal(0)
@@ -1626,65 +1837,100 @@ class PoolLiquidityFilter:
 
         return liquidity_usd
 
-    def _calculate_v3_v4_liquidity_from_state(
-        self,
+    @staticmethod
+    def _resolve_pool_tokens(
         pool_data: Dict,
-        state: Dict,
-        prices: Dict[str, Decimal],
+        prices: Dict[str, float],
         token_decimals: Dict[str, int],
-    ) -> Optional[Decimal]:
+    ) -> Tuple[Optional[float], Optional[float], int, int]:
         """
-        Calculate liquidity for a V3/V4 pool using pre-fetched state.
+        Look up a pool's token prices and decimals.
 
         Args:
             pool_data: Pool metadata including token addresses
-            state: Pre-fetched pool state from batcher
             prices: Token prices in USD
             token_decimals: Token decimals mapping
 
         Returns:
-            Liquidity in USD or None if cannot calculate
+            Tuple of (price0, price1, decimals0, decimals1)
         """
-        if not state or "liquidity" not in state:
-            return None
-
         token0_addr = pool_data["token0"]["address"]
         token1_addr = pool_data["token1"]["address"]
+        return (
+            prices.get(token0_addr),
+            prices.get(token1_addr),
+            token_decimals.get(token0_addr, 18),
+            token_decimals.get(token1_addr, 18),
+        )
 
-        # Get prices
-        price0 = prices.get(token0_addr)
-        price1 = prices.get(token1_addr)
+    def _calculate_v3_v4_liquidity_from_state(
+        self,
+        state: Dict,
+        resolved: Tuple[Optional[float], Optional[float], int, int],
+    ) -> Optional[float]:
+        """
+        Calculate liquidity for a V3/V4 pool using pre-fetched state.
+
+        Args:
+            state: Pre-fetched pool state from batcher
+            resolved: (price0, price1, decimals0, decimals1) from
+                _resolve_pool_tokens
+
+        Returns:
+            Rough liquidity in USD or None if cannot calculate
+        """
+        # A missing or partial state (failed batch entry) means no estimate
+        try:
+            liquidity_raw = state["liquidity"]
+            sqrt_price_raw = state["sqrtPriceX96"]
+        except (KeyError, TypeError):
+            return None
+
+        # Dead pools are common in a whitelist scan; the batcher hands
+        # liquidity back as a decimal string, reth as an int, so reject a
+        # zero before paying for any bigint parsing
+        if not liquidity_raw or liquidity_raw == "0":
+            return None
+
+        price0, price1, decimals0, decimals1 = resolved
 
         if not price0 and not price1:
             return None
 
         # Parse state
-        liquidity = int(state["liquidity"])
-        sqrt_price_x96 = int(state["sqrtPriceX96"])
+        liquidity = int(liquidity_raw)
+        sqrt_price_x96 = int(sqrt_price_raw)
 
-        if liquidity == 0:
+        if liquidity == 0 or sqrt_price_x96 == 0:
             return None
 
-        decimals0 = token_decimals.get(token0_addr, 18)
-        decimals1 = token_decimals.get(token1_addr, 18)
-
-        # Simplified TVL estimation using liquidity value
-        # For V3/V4, liquidity represents sqrt(amount0 * amount1)
-        # This is a simplified calculation - actual TVL requires integration over tick range
-        liquidity_decimal = Decimal(liquidity)
+        # Virtual reserves at the current price: x = L / sqrtP, y = L * sqrtP.
+        # This ignores where positions actually sit in the tick range, but uses
+        # the pool's own price instead of assuming it matches the USD prices.
+        # It's a rough estimate, so the math stays in float throughout
+        liquidity_float = float(liquidity)
+        sqrt_price = math.ldexp(sqrt_price_x96, -96)
 
         # Calculate rough USD value
-        if price0 and price1:
-            # Use geometric mean of both token values
-            value0 = liquidity_decimal * price0 / Decimal(10**decimals0)
-            value1 = liquidity_decimal * price1 / Decimal(10**decimals1)
-            return (value0 + value1) / 2
-        elif price0:
-            return liquidity_decimal * price0 / Decimal(10**decimals0)
-        elif price1:
-            return liquidity_decimal * price1 / Decimal(10**decimals1)
-
-        return None
+        value0 = (
+            liquidity_float / sqrt_price * price0 / _POW10_FLOAT[decimals0]
+            if price0
+            else None
+        )
+        value1 = (
+            liquidity_float * sqrt_price * price1 / _POW10_FLOAT[decimals1]
+            if price1
+            else None
+        )
+
+        if value0 is not None and value1 is not None:
+            liquidity_usd = value0 + value1
+        else:
+            # Both sides of the virtual reserves hold equal value at the
+            # pool price, so one priced side stands for half the TVL
+            liquidity_usd = 2.0 * (value0 if value0 is not None else value1)
+
+        return liquidity_usd
 
     def _fetch_v2_reserves_from_reth(
         self, pool_addresses: List[str]
@@ -1696,7 +1942,7 @@ class PoolLiquidityFilter:
             pool_addresses: List of V2 pool addresses
 
         Returns:
-            Dict mapping pool_address -> reserves_dict (with hex strings)
+            Dict mapping pool_address -> reserves_dict (with int reserves)
         """
         import time
 
@@ -1709,10 +1955,10 @@ class PoolLiquidityFilter:
                     pool_addr
                 )
 
-                # Convert to format expected by existing code (hex strings)
+                # Same shape as UniswapV2ReservesBatcher results
                 results[pool_addr.lower()] = {
-                    "reserve0": hex(reserves.get("reserve0", 0)),
-                    "reserve1": hex(reserves.get("reserve1", 0)),
+                    "reserve0": reserves.get("reserve0", 0),
+                    "reserve1": reserves.get("reserve1", 0),
                     "blockTimestampLast": reserves.get("block_timestamp_last", 0),
                 }
             except Exception as e:
@@ -36,6 +36,12 @@ class DecimalEncoder(json.JSONEncoder):
         return super().default(obj)
 
 
+def _write_json(path: Path, data: Any, indent: Optional[int] = None) -> None:
+    """Write data to path as JSON, converting Decimals to strings."""
+    with open(path, "w") as f:
+        json.dump(data, f, indent=indent, cls=DecimalEncoder)
+
+
 from src.config import ConfigManager
 from src.core.storage.postgres import PostgresStorage
 from src.core.storage.token_whitelist_publisher import TokenWhitelistNatsPublisher
@@ -51,6 +57,40 @@ from src.whitelist.pool_types import PoolInfo, TokenPrice
 
 logger = logging.getLogger(__name__)
 
+# Step 2 pool query over network_1_dex_pools_cryo (includes fee and tick_spacing).
+# Protocol is tagged from the factory lists and V4 pools with hooks are
+# dropped (temporary - hooks not yet supported) in SQL, so neither
+# unknown factories nor additional_data have to cross the wire.
+# $1 tokens, $2/$3/$4 V2/V3/V4 factories, $5 zero address.
+WHITELIST_POOLS_QUERY = """
+SELECT DISTINCT
+    LOWER(address) as address,
+    LOWER(asset0) as token0,
+    LOWER(asset1) as token1,
+    LOWER(factory) as factory,
+    fee,
+    tick_spacing,
+    CASE
+        WHEN LOWER(factory) = ANY($2) THEN 'v2'
+        WHEN LOWER(factory) = ANY($3) THEN 'v3'
+        ELSE 'v4'
+    END as protocol
+FROM network_1_dex_pools_cryo
+WHERE (
+    LOWER(asset0) = ANY($1) AND LOWER(asset1) = ANY($1)
+)
+AND (
+    LOWER(factory) = ANY($2)
+    OR LOWER(factory) = ANY($3)
+    OR (
+        LOWER(factory) = ANY($4)
+        AND COALESCE(
+            LOWER(additional_data->>'hooks_address'), $5
+        ) IN ('', $5)
+    )
+)
+"""
+
 
 class WhitelistOrchestrator:
     """Orchestrate the complete whitelist and pool filtering pipeline."""
@@ -113,8 +153,8 @@ class WhitelistOrchestrator:
         # Extract whitelisted token addresses
         whitelisted_tokens = set(whitelist_result["tokens"])
 
-        # Extract token metadata from whitelist
-        token_info = whitelist_result.get("token_info", {})
+        # Extract token metadata from whitelist (copied - native ETH is added below)
+        token_info = dict(whitelist_result.get("token_info", {}))
         token_symbols = {
             addr: info.get("symbol", "")
             for addr, info in token_info.items()
@@ -188,71 +228,33 @@ class WhitelistOrchestrator:
 
         # Query pools from database - get ALL pools where BOTH tokens are whitelisted
         # This includes Stage 1 (whitelisted+trusted) and Stage 2 (whitelisted+whitelisted)
-        # Include zero address for V4 pools with native ETH
-        all_tokens_for_query = (
-            whitelisted_tokens | trusted_token_addresses | {zero_addr}
-        )
-
-        # Query pools from network_1_dex_pools_cryo (includes fee, tick_spacing and additional_data)
-        query = """
-        SELECT DISTINCT
-            address,
-            LOWER(asset0) as token0,
-            LOWER(asset1) as token1,
-            LOWER(factory) as factory,
-            fee,
-            tick_spacing,
-            additional_data
-        FROM network_1_dex_pools_cryo
-        WHERE (
-            LOWER(asset0) = ANY($1) AND LOWER(asset1) = ANY($1)
-        )
-        """
+        # all_tokens already includes the zero address for V4 pools with native ETH.
+        # One ANY($1) round trip over the whole set; probing token pairs
+        # individually would be |tokens|^2 statements
+        all_tokens_for_query = list(all_tokens)
 
         async with self.storage.pool.acquire() as conn:
-            results = await conn.fetch(query, list(all_tokens_for_query))
+            results = await conn.fetch(
+                WHITELIST_POOLS_QUERY,
+                all_tokens_for_query,
+                v2_factories,
+                v3_factories,
+                v4_factories,
+                zero_addr,
+            )
 
         # Group pools by address and format
         pools = {}
-        v4_pools_with_hooks_filtered = 0
 
         for row in results:
-            pool_addr = row["address"].lower()
-            factory = row["factory"].lower()
+            # Address, tokens and factory come back lowercased from the query
+            pool_addr = row["address"]
+            factory = row["factory"]
             token0 = row["token0"]
             token1 = row["token1"]
             fee = row["fee"]
             tick_spacing = row["tick_spacing"]
-            additional_data = row.get("additional_data")
-
-            # Identify protocol
-            if factory in v2_factories:
-                protocol = "v2"
-            elif factory in v3_factories:
-                protocol = "v3"
-            elif factory in v4_factories:
-                protocol = "v4"
-
-                # Filter out V4 pools with hooks (temporary - hooks not yet supported)
-                if additional_data:
-                    # Parse JSON if it's a string (asyncpg returns jsonb as string)
-                    import json
-
-                    if isinstance(additional_data, str):
-                        try:
-                            additional_data = json.loads(additional_data)
-                        except json.JSONDecodeError:
-                            pass  # If parsing fails, skip the filter
-
-                    if isinstance(additional_data, dict):
-                        hooks_address = additional_data.get("hooks_address", "").lower()
-                        zero_address = "0x0000000000000000000000000000000000000000"
-
-                        if hooks_address and hooks_address != zero_address:
-                            v4_pools_with_hooks_filtered += 1
-                            continue  # Skip V4 pools with hooks
-            else:
-                continue  # Skip unknown protocols
+            protocol = row["protocol"]
 
             # For V4, pool_addr is the pool_id, and factory is the pool manager
             if protocol == "v4":
@@ -277,11 +279,6 @@ class WhitelistOrchestrator:
                     "tick_spacing": tick_spacing,  # Include for V3/V4 (will be None for V2)
                 }
 
-        if v4_pools_with_hooks_filtered > 0:
-            self.logger.info(
-                f"⚠️  Filtered out {v4_pools_with_hooks_filtered} V4 pools with hooks"
-            )
-
         self.logger.info(f"✅ Found {len(pools)} pools")
 
         # Step 3: Filter pools with comprehensive price discovery
@@ -319,37 +316,40 @@ class WhitelistOrchestrator:
         # This preserves V4 pool_id and other important metadata
         filtered_pools = list(filtered_pools_dict.values())
 
+        # First filtered pool containing each token, for the pool_address field
+        token_to_pool = {}
+        for p_addr, p_data in filtered_pools_dict.items():
+            token_to_pool.setdefault(p_data["token0"]["address"], p_addr)
+            token_to_pool.setdefault(p_data["token1"]["address"], p_addr)
+
         # Convert discovered prices to TokenPrice objects for compatibility
         token_prices = {}
         for token_addr, price in discovered_prices.items():
-            # Find a pool that contains this token for the pool_address field
-            pool_addr = None
-            for p_addr, p_data in filtered_pools_dict.items():
-                if token_addr in [
-                    p_data["token0"]["address"],
-                    p_data["token1"]["address"],
-                ]:
-                    pool_addr = p_addr
-                    break
-
             token_prices[token_addr] = TokenPrice(
                 token_address=token_addr,
                 price_in_trusted=price,
                 trusted_token="USD",  # Prices are in USD
-                pool_address=pool_addr or "",
+                pool_address=token_to_pool.get(token_addr, ""),
                 liquidity=Decimal("0"),  # Not tracked individually
             )
 
         # Step 4: Prepare whitelist for publishing
         self.logger.info("STEP 4: PREPARE WHITELIST FOR PUBLISHING")
 
-        # Format whitelist for publishing
+        # Format whitelist for publishing, and in the same pass the token
+        # metadata published to NATS in Step 5c
+        token_sources = whitelist_result.get("token_sources", {})
+        whitelist_token_info = whitelist_result.get("token_info", {})
         whitelist_for_publishing = []
+        tokens_for_nats = {}
+        skipped_tokens = 0
+
         for token in whitelisted_tokens:
+            sources = token_sources.get(token, [])
             token_data = {
                 "address": token,
-                "sources": whitelist_result.get("token_sources", {}).get(token, []),
-                "info": whitelist_result.get("token_info", {}).get(token, {}),
+                "sources": sources,
+                "info": whitelist_token_info.get(token, {}),
             }
 
             # Add price if available
@@ -364,6 +364,24 @@ class WhitelistOrchestrator:
 
             whitelist_for_publishing.append(token_data)
 
+            # NATS token whitelist - MUST have decimals and symbol
+            token_metadata = token_info.get(token, {})
+
+            # Skip tokens with missing required metadata
+            if not token_metadata.get("decimals") or not token_metadata.get("symbol"):
+                self.logger.warning(
+                    f"Skipping token {token}: missing decimals or symbol"
+                )
+                skipped_tokens += 1
+                continue
+
+            tokens_for_nats[token] = {
+                "symbol": token_metadata["symbol"],
+                "decimals": token_metadata["decimals"],
+                "name": token_metadata.get("name", ""),
+                "filters": sources,
+            }
+
         # Metadata for publishing
         publish_metadata = {
             "chain": chain,
@@ -382,323 +400,296 @@ class WhitelistOrchestrator:
         # Step 5: Publish whitelist to Redis, NATS, and JSON
         self.logger.info("STEP 5: PUBLISH WHITELIST")
 
-        async with WhitelistPublisher(self.config) as publisher:
-            publish_results = await publisher.publish_whitelist(
-                chain=chain,
-                whitelist=whitelist_for_publishing,
-                metadata=publish_metadata,
-            )
+        # Prepare pools with full metadata for NATS publishing (Step 5b)
+        pools_for_nats = []
+        skipped_pools = 0
 
-            self.logger.info(f"Token whitelist publishing results: {publish_results}")
+        for pool_data in filtered_pools:
+            # Get token addresses
+            token0_addr = pool_data["token0"]["address"]
+            token1_addr = pool_data["token1"]["address"]
 
-        # Step 5b: Publish pool whitelist to NATS (for ExEx and poolStateArena)
-        # Using WhitelistManager for differential updates
-        self.logger.info("STEP 5b: PUBLISH POOL WHITELIST TO NATS (DIFFERENTIAL)")
+            # Get token info - MUST have decimals and symbol
+            token0_info = token_info.get(token0_addr, {})
+            token1_info = token_info.get(token1_addr, {})
 
-        # Prepare pools with full metadata for NATS publishing
-        if filtered_pools:
-            pools_for_nats = []
-            skipped_pools = 0
+            # Skip pools with missing token metadata (decimals or symbol)
+            if not token0_info.get("decimals") or not token0_info.get("symbol"):
+                pool_id = pool_data.get("pool_id", pool_data.get("address"))
+                self.logger.warning(
+                    f"Skipping pool {pool_id}: missing token0 metadata "
+                    f"(token: {token0_addr})"
+                )
+                skipped_pools += 1
+                continue
 
-            for pool_data in filtered_pools:
-                # Get token addresses
-                token0_addr = pool_data["token0"]["address"]
-                token1_addr = pool_data["token1"]["address"]
+            if not token1_info.get("decimals") or not token1_info.get("symbol"):
+                pool_id = pool_data.get("pool_id", pool_data.get("address"))
+                self.logger.warning(
+                    f"Skipping pool {pool_id}: missing token1 metadata "
+                    f"(token: {token1_addr})"
+                )
+                skipped_pools += 1
+                continue
+
+            # Build pool dict with proper structure for V2/V3/V4
+            pool_dict = {
+                "address": pool_data["address"],
+                "token0": {
+                    "address": token0_addr,
+                    "decimals": token0_info["decimals"],
+                    "symbol": token0_info["symbol"],
+                    "name": token0_info.get("name", ""),
+                },
+                "token1": {
+                    "address": token1_addr,
+                    "decimals": token1_info["decimals"],
+                    "symbol": token1_info["symbol"],
+                    "name": token1_info.get("name", ""),
+                },
+                "protocol": pool_data["protocol"],
+                "factory": pool_data["factory"],
+            }
 
-                # Get token info - MUST have decimals and symbol
-                token0_info = token_info.get(token0_addr, {})
-                token1_info = token_info.get(token1_addr, {})
+            # Add V4-specific pool_id field (32-byte identifier)
+            if "pool_id" in pool_data:
+                pool_dict["pool_id"] = pool_data["pool_id"]
 
-                # Skip pools with missing token metadata (decimals or symbol)
-                if not token0_info.get("decimals") or not token0_info.get("symbol"):
+            # Add protocol-specific required fields for V3/V4
+            # V2 pools don't have fee/tick_spacing
+            if pool_data["protocol"] in ["v3", "v4"]:
+                # Fee is required for V3/V4 (needed for swap calculations)
+                if "fee" not in pool_data or pool_data["fee"] is None:
                     pool_id = pool_data.get("pool_id", pool_data.get("address"))
                     self.logger.warning(
-                        f"Skipping pool {pool_id}: missing token0 metadata "
-                        f"(token: {token0_addr})"
+                        f"Skipping {pool_data['protocol']} pool {pool_id}: missing fee"
                     )
                     skipped_pools += 1
                     continue
 
-                if not token1_info.get("decimals") or not token1_info.get("symbol"):
+                # tick_spacing is required for V3/V4 (needed for tick validation)
+                if "tick_spacing" not in pool_data or pool_data["tick_spacing"] is None:
                     pool_id = pool_data.get("pool_id", pool_data.get("address"))
                     self.logger.warning(
-                        f"Skipping pool {pool_id}: missing token1 metadata "
-                        f"(token: {token1_addr})"
+                        f"Skipping {pool_data['protocol']} pool {pool_id}: "
+                        f"missing tick_spacing"
                     )
                     skipped_pools += 1
                     continue
 
-                # Build pool dict with proper structure for V2/V3/V4
-                pool_dict = {
-                    "address": pool_data["address"],
-                    "token0": {
-                        "address": token0_addr,
-                        "decimals": token0_info["decimals"],
-                        "symbol": token0_info["symbol"],
-                        "name": token0_info.get("name", ""),
-                    },
-                    "token1": {
-                        "address": token1_addr,
-                        "decimals": token1_info["decimals"],
-                        "symbol": token1_info["symbol"],
-                        "name": token1_info.get("name", ""),
-                    },
-                    "protocol": pool_data["protocol"],
-                    "factory": pool_data["factory"],
-                }
+                pool_dict["fee"] = pool_data["fee"]
+                pool_dict["tick_spacing"] = pool_data["tick_spacing"]
 
-                # Add V4-specific pool_id field (32-byte identifier)
-                if "pool_id" in pool_data:
-                    pool_dict["pool_id"] = pool_data["pool_id"]
-
-                # Add protocol-specific required fields for V3/V4
-                # V2 pools don't have fee/tick_spacing
-                if pool_data["protocol"] in ["v3", "v4"]:
-                    # Fee is required for V3/V4 (needed for swap calculations)
-                    if "fee" not in pool_data or pool_data["fee"] is None:
-                        pool_id = pool_data.get("pool_id", pool_data.get("address"))
-                        self.logger.warning(
-                            f"Skipping {pool_data['protocol']} pool {pool_id}: "
-                            f"missing fee"
-                        )
-                        skipped_pools += 1
-                        continue
-
-                    # tick_spacing is required for V3/V4 (needed for tick validation)
-                    if (
-                        "tick_spacing" not in pool_data
-                        or pool_data["tick_spacing"] is None
-                    ):
-                        pool_id = pool_data.get("pool_id", pool_data.get("address"))
-                        self.logger.warning(
-                            f"Skipping {pool_data['protocol']} pool {pool_id}: "
-                            f"missing tick_spacing"
-                        )
-                        skipped_pools += 1
-                        continue
+            pools_for_nats.append(pool_dict)
 
-                    pool_dict["fee"] = pool_data["fee"]
-                    pool_dict["tick_spacing"] = pool_data["tick_spacing"]
+        if skipped_pools > 0:
+            self.logger.warning(
+                f"Skipped {skipped_pools} pools due to missing token metadata"
+            )
 
-                pools_for_nats.append(pool_dict)
+        if skipped_tokens > 0:
+            self.logger.warning(
+                f"Skipped {skipped_tokens} tokens due to missing metadata"
+            )
 
-            if skipped_pools > 0:
-                self.logger.warning(
-                    f"Skipped {skipped_pools} pools due to missing token metadata"
+        # The three publishers use separate connections and don't depend on
+        # each other, so publish concurrently: Step 5 takes as long as the
+        # slowest publish rather than the sum of all three
+        async def publish_token_whitelist() -> Dict:
+            try:
+                async with WhitelistPublisher(self.config) as publisher:
+                    token_whitelist_results = await publisher.publish_whitelist(
+                        chain=chain,
+                        whitelist=whitelist_for_publishing,
+                        metadata=publish_metadata,
+                    )
+            except Exception as e:
+                self.logger.error(
+                    f"Failed to publish token whitelist: {e}", exc_info=True
                 )
+                return {"redis": False, "json": False, "nats": False}
 
-            # Publish to NATS using WhitelistManager (differential updates)
-            if pools_for_nats:
-                try:
-                    # Prepare database config for WhitelistManager
-                    db_config = {
-                        "host": self.config.database.POSTGRES_HOST,
-                        "port": self.config.database.POSTGRES_PORT,
-                        "user": self.config.database.POSTGRES_USER,
-                        "password": self.config.database.POSTGRES_PASSWORD,
-                        "database": self.config.database.POSTGRES_DB,
-                    }
-
-                    # Use WhitelistManager for differential updates
-                    async with WhitelistManager(db_config) as wl_manager:
-                        # Publish differential update (Add/Remove/Full)
-                        update_result = await wl_manager.publish_differential_update(
-                            chain=chain, new_pools=pools_for_nats
-                        )
+            self.logger.info(
+                f"Token whitelist publishing results: {token_whitelist_results}"
+            )
+            return token_whitelist_results
 
-                        self.logger.info(
-                            f"📊 Whitelist differential update published: "
-                            f"{update_result['update_type']} - "
-                            f"+{update_result['added']} added, "
-                            f"-{update_result['removed']} removed, "
-                            f"total {update_result['total_pools']} pools "
-                            f"(snapshot {update_result['snapshot_id']})"
-                        )
+        async def publish_pools_to_nats() -> Dict:
+            # Step 5b: Publish pool whitelist to NATS (for ExEx and poolStateArena)
+            # Using WhitelistManager for differential updates
+            self.logger.info("STEP 5b: PUBLISH POOL WHITELIST TO NATS (DIFFERENTIAL)")
 
-                        publish_results.update(
-                            {
-                                "nats_pools_minimal": update_result["published"],
-                                "nats_pools_full": update_result["published"],
-                                "nats_pools_count": update_result["total_pools"],
-                                "nats_pools_added": update_result["added"],
-                                "nats_pools_removed": update_result["removed"],
-                                "nats_update_type": update_result["update_type"],
-                                "nats_snapshot_id": update_result["snapshot_id"],
-                            }
-                        )
-                except Exception as e:
-                    self.logger.error(
-                        f"Failed to publish pools to NATS: {e}", exc_info=True
-                    )
-                    publish_results.update(
-                        {
-                            "nats_pools_minimal": False,
-                            "nats_pools_full": False,
-                            "nats_pools_count": 0,
-                            "nats_pools_added": 0,
-                            "nats_pools_removed": 0,
-                            "nats_update_type": "error",
-                        }
-                    )
-            else:
+            if not filtered_pools:
+                self.logger.warning("No pools to publish to NATS")
+                return {}
+
+            if not pools_for_nats:
                 self.logger.warning(
                     "No pools with complete metadata to publish to NATS"
                 )
-                publish_results.update(
-                    {
-                        "nats_pools_minimal": False,
-                        "nats_pools_full": False,
-                        "nats_pools_count": 0,
-                        "nats_pools_added": 0,
-                        "nats_pools_removed": 0,
-                        "nats_update_type": "skipped",
-                    }
-                )
-        else:
-            self.logger.warning("No pools to publish to NATS")
-
-        # Step 5c: Publish token whitelist to NATS (for dynamic token tracking)
-        self.logger.info("STEP 5c: PUBLISH TOKEN WHITELIST TO NATS")
-
-        # Prepare tokens with metadata for NATS publishing
-        if whitelisted_tokens:
-            tokens_for_nats = {}
-            skipped_tokens = 0
+                return {
+                    "nats_pools_minimal": False,
+                    "nats_pools_full": False,
+                    "nats_pools_count": 0,
+                    "nats_pools_added": 0,
+                    "nats_pools_removed": 0,
+                    "nats_update_type": "skipped",
+                }
 
-            for token in whitelisted_tokens:
-                # Get token info - MUST have decimals and symbol
-                token_metadata = token_info.get(token, {})
+            try:
+                # Prepare database config for WhitelistManager
+                db_config = {
+                    "host": self.config.database.POSTGRES_HOST,
+                    "port": self.config.database.POSTGRES_PORT,
+                    "user": self.config.database.POSTGRES_USER,
+                    "password": self.config.database.POSTGRES_PASSWORD,
+                    "database": self.config.database.POSTGRES_DB,
+                }
 
-                # Skip tokens with missing required metadata
-                if not token_metadata.get("decimals") or not token_metadata.get(
-                    "symbol"
-                ):
-                    self.logger.warning(
-                        f"Skipping token {token}: missing decimals or symbol"
+                # Use WhitelistManager for differential updates
+                async with WhitelistManager(db_config) as wl_manager:
+                    # Publish differential update (Add/Remove/Full)
+                    update_result = await wl_manager.publish_differential_update(
+                        chain=chain, new_pools=pools_for_nats
                     )
-                    skipped_tokens += 1
-                    continue
 
-                # Get sources/filters for this token
-                token_filters = whitelist_result.get("token_sources", {}).get(token, [])
+                self.logger.info(
+                    f"📊 Whitelist differential update published: "
+                    f"{update_result['update_type']} - "
+                    f"+{update_result['added']} added, "
+                    f"-{update_result['removed']} removed, "
+                    f"total {update_result['total_pools']} pools "
+                    f"(snapshot {update_result['snapshot_id']})"
+                )
 
-                tokens_for_nats[token] = {
-                    "symbol": token_metadata["symbol"],
-                    "decimals": token_metadata["decimals"],
-                    "name": token_metadata.get("name", ""),
-                    "filters": token_filters,
+                return {
+                    "nats_pools_minimal": update_result["published"],
+                    "nats_pools_full": update_result["published"],
+                    "nats_pools_count": update_result["total_pools"],
+                    "nats_pools_added": update_result["added"],
+                    "nats_pools_removed": update_result["removed"],
+                    "nats_update_type": update_result["update_type"],
+                    "nats_snapshot_id": update_result["snapshot_id"],
                 }
+            except Exception as e:
+                self.logger.error(
+                    f"Failed to publish pools to NATS: {e}", exc_info=True
+                )
+                return {
+                    "nats_pools_minimal": False,
+                    "nats_pools_full": False,
+                    "nats_pools_count": 0,
+                    "nats_pools_added": 0,
+                    "nats_pools_removed": 0,
+                    "nats_update_type": "error",
+                }
+
+        async def publish_tokens_to_nats() -> Dict:
+            # Step 5c: Publish token whitelist to NATS (for dynamic token tracking)
+            self.logger.info("STEP 5c: PUBLISH TOKEN WHITELIST TO NATS")
+
+            if not whitelisted_tokens:
+                self.logger.warning("No tokens to publish to NATS")
+                return {}
 
-            if skipped_tokens > 0:
+            if not tokens_for_nats:
                 self.logger.warning(
-                    f"Skipped {skipped_tokens} tokens due to missing metadata"
+                    "No tokens with complete metadata to publish to NATS"
                 )
+                return {
+                    "nats_tokens_full": False,
+                    "nats_tokens_add": False,
+                    "nats_tokens_remove": False,
+                    "nats_tokens_count": 0,
+                }
 
             # Publish to NATS (full + delta topics)
-            if tokens_for_nats:
-                try:
-                    async with TokenWhitelistNatsPublisher() as token_publisher:
-                        token_publish_results = (
-                            await token_publisher.publish_token_whitelist(
-                                chain=chain, tokens=tokens_for_nats
-                            )
+            try:
+                async with TokenWhitelistNatsPublisher() as token_publisher:
+                    token_publish_results = (
+                        await token_publisher.publish_token_whitelist(
+                            chain=chain, tokens=tokens_for_nats
                         )
-                        self.logger.info(
-                            f"Token whitelist NATS publishing results: {token_publish_results}"
-                        )
-                        publish_results.update(
-                            {
-                                "nats_tokens_full": token_publish_results.get(
-                                    "full", False
-                                ),
-                                "nats_tokens_add": token_publish_results.get(
-                                    "add", False
-                                ),
-                                "nats_tokens_remove": token_publish_results.get(
-                                    "remove", False
-                                ),
-                                "nats_tokens_count": len(tokens_for_nats),
-                            }
-                        )
-                except Exception as e:
-                    self.logger.error(
-                        f"Failed to publish tokens to NATS: {e}", exc_info=True
-                    )
-                    publish_results.update(
-                        {
-                            "nats_tokens_full": False,
-                            "nats_tokens_add": False,
-                            "nats_tokens_remove": False,
-                            "nats_tokens_count": 0,
-                        }
                     )
-            else:
-                self.logger.warning(
-                    "No tokens with complete metadata to publish to NATS"
+                self.logger.info(
+                    f"Token whitelist NATS publishing results: {token_publish_results}"
                 )
-                publish_results.update(
-                    {
-                        "nats_tokens_full": False,
-                        "nats_tokens_add": False,
-                        "nats_tokens_remove": False,
-                        "nats_tokens_count": 0,
-                    }
+                return {
+                    "nats_tokens_full": token_publish_results.get("full", False),
+                    "nats_tokens_add": token_publish_results.get("add", False),
+                    "nats_tokens_remove": token_publish_results.get("remove", False),
+                    "nats_tokens_count": len(tokens_for_nats),
+                }
+            except Exception as e:
+                self.logger.error(
+                    f"Failed to publish tokens to NATS: {e}", exc_info=True
                 )
-        else:
-            self.logger.warning("No tokens to publish to NATS")
+                return {
+                    "nats_tokens_full": False,
+                    "nats_tokens_add": False,
+                    "nats_tokens_remove": False,
+                    "nats_tokens_count": 0,
+                }
+
+        (
+            publish_results,
+            pool_publish_results,
+            token_nats_results,
+        ) = await asyncio.gather(
+            publish_token_whitelist(),
+            publish_pools_to_nats(),
+            publish_tokens_to_nats(),
+        )
+        publish_results.update(pool_publish_results)
+        publish_results.update(token_nats_results)
 
         # Step 6: Save detailed results locally
         self.logger.info("STEP 6: SAVE DETAILED RESULTS")
 
+        # Indented output and the per-stage breakdown are only worth their
+        # serialisation cost when debugging; the published artifacts are compact
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        json_indent = 2 if debug else None
+
         # Save whitelist by stage for debugging
-        whitelist_stages_path = self.output_dir / f"whitelist_by_stage_{chain}.json"
-        with open(whitelist_stages_path, "w") as f:
-            json.dump(
-                {
-                    "metadata": {
-                        "chain": chain,
-                        "generated_at": datetime.now(UTC).isoformat(),
-                        "total_tokens": len(whitelisted_tokens),
-                    },
-                    "breakdown": whitelist_result.get("breakdown", {}),
-                    "cross_chain_tokens": [
-                        addr
-                        for addr, sources in whitelist_result.get(
-                            "token_sources", {}
-                        ).items()
-                        if "cross_chain" in sources
-                    ],
-                    "hyperliquid_tokens": [
-                        addr
-                        for addr, sources in whitelist_result.get(
-                            "token_sources", {}
-                        ).items()
-                        if "hyperliquid" in sources
-                    ],
-                    "lighter_tokens": [
-                        addr
-                        for addr, sources in whitelist_result.get(
-                            "token_sources", {}
-                        ).items()
-                        if "lighter" in sources
-                    ],
-                    "top_transferred_tokens": [
-                        addr
-                        for addr, sources in whitelist_result.get(
-                            "token_sources", {}
-                        ).items()
-                        if "top_transferred" in sources
-                    ],
-                    "unmapped_hyperliquid": whitelist_result.get(
-                        "unmapped_hyperliquid", {}
-                    ),
-                    "unmapped_lighter": whitelist_result.get("unmapped_lighter", {}),
+        if debug:
+            whitelist_stages_path = self.output_dir / f"whitelist_by_stage_{chain}.json"
+            stages_data = {
+                "metadata": {
+                    "chain": chain,
+                    "generated_at": datetime.now(UTC).isoformat(),
+                    "total_tokens": len(whitelisted_tokens),
                 },
-                f,
-                indent=2,
-                cls=DecimalEncoder,
+                "breakdown": whitelist_result.get("breakdown", {}),
+                "cross_chain_tokens": [
+                    addr
+                    for addr, sources in token_sources.items()
+                    if "cross_chain" in sources
+                ],
+                "hyperliquid_tokens": [
+                    addr
+                    for addr, sources in token_sources.items()
+                    if "hyperliquid" in sources
+                ],
+                "lighter_tokens": [
+                    addr
+                    for addr, sources in token_sources.items()
+                    if "lighter" in sources
+                ],
+                "top_transferred_tokens": [
+                    addr
+                    for addr, sources in token_sources.items()
+                    if "top_transferred" in sources
+                ],
+                "unmapped_hyperliquid": whitelist_result.get(
+                    "unmapped_hyperliquid", {}
+                ),
+                "unmapped_lighter": whitelist_result.get("unmapped_lighter", {}),
+            }
+            await asyncio.to_thread(
+                _write_json, whitelist_stages_path, stages_data, json_indent
             )
-        self.logger.info(f"💾 Saved whitelist by stage to {whitelist_stages_path}")
+            self.logger.info(f"💾 Saved whitelist by stage to {whitelist_stages_path}")
 
         results = {
             "whitelist": {
@@ -731,9 +722,6 @@ class WhitelistOrchestrator:
 
         # Save complete results
         results_path = self.output_dir / f"pipeline_results_{chain}.json"
-        with open(results_path, "w") as f:
-            json.dump(results, f, indent=2, cls=DecimalEncoder)
-        self.logger.info(f"Saved complete results to {results_path}")
 
         # Save pools separately for easy access
         pools_path = self.output_dir / f"filtered_pools_{chain}.json"
@@ -745,8 +733,13 @@ class WhitelistOrchestrator:
             },
             "pools": filtered_pools,
         }
-        with open(pools_path, "w") as f:
-            json.dump(pools_data, f, indent=2, cls=DecimalEncoder)
+
+        # Serialise off the event loop, both files at once
+        await asyncio.gather(
+            asyncio.to_thread(_write_json, results_path, results, json_indent),
+            asyncio.to_thread(_write_json, pools_path, pools_data, json_indent),
+        )
+        self.logger.info(f"Saved complete results to {results_path}")
         self.logger.info(f"Saved filtered pools to {pools_path}")
 
         self.logger.info("=" * 80)
@@ -781,8 +774,8 @@ async def main():
         "user": config.database.POSTGRES_USER,
         "password": config.database.POSTGRES_PASSWORD,
         "database": config.database.POSTGRES_DB,
-        "pool_size": 10,
-        "pool_timeout": 10,
+        "pool_size": config.database.MAX_CONNECTIONS,
+        "pool_timeout": config.database.CONNECTION_TIMEOUT,
     }
 
     storage = PostgresStorage(config=db_config)
@@ -11,6 +11,8 @@ import sys
 from pathlib import Path
 from pprint import pprint
 
+import pytest
+
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
@@ -268,5 +270,58 @@ async def test_whitelist_builder():
         await storage.disconnect()
 
 
+@pytest.mark.asyncio
+async def test_build_whitelist_merges_metadata_in_source_order(monkeypatch, tmp_path):
+    """Token metadata precedence follows criterion order, not completion order."""
+    from src.whitelist import builder as builder_module
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(builder_module, "SYMBOL_CACHE_PATH", tmp_path / "symbols.json")
+
+    shared = "0x" + "11" * 20
+    lighter_only = "0x" + "22" * 20
+
+    def source(delay, addresses, info):
+        async def fetch(*args):
+            await asyncio.sleep(delay)
+            return set(addresses), info
+
+        return fetch
+
+    builder = TokenWhitelistBuilder(storage=None)
+    # Cross-chain finishes last and Lighter first, but their metadata must
+    # still be merged cross-chain > Hyperliquid > Lighter > top transferred
+    monkeypatch.setattr(
+        builder,
+        "get_cross_chain_tokens",
+        source(0.03, [shared], {shared: {"symbol": "CROSS"}}),
+    )
+    monkeypatch.setattr(
+        builder,
+        "get_hyperliquid_tokens",
+        source(0.02, [shared], {shared: {"symbol": "HL"}}),
+    )
+    monkeypatch.setattr(
+        builder,
+        "get_lighter_tokens",
+        source(
+            0.0,
+            [shared, lighter_only],
+            {shared: {"symbol": "LIGHTER"}, lighter_only: {"symbol": "LTR"}},
+        ),
+    )
+    monkeypatch.setattr(
+        builder,
+        "get_top_transferred_tokens",
+        source(0.01, [lighter_only], {lighter_only: {"ranking_score": 1.0}}),
+    )
+
+    result = await builder.build_whitelist(top_transfers=1)
+
+    assert result["token_info"][shared] == {"symbol": "CROSS"}
+    assert result["token_info"][lighter_only] == {"symbol": "LTR"}
+    assert result["token_sources"][shared] == ["cross_chain", "hyperliquid", "lighter"]
+
+
 if __name__ == "__main__":
     result = asyncio.run(test_whitelist_builder())
@@ -4,6 +4,8 @@ Test suite for PoolLiquidityFilter.
 Tests the liquidity filtering functionality for V2, V3, and V4 pools.
 """
 
+import json
+from contextlib import asynccontextmanager
 from decimal import Decimal
 
 import pytest
@@ -11,7 +13,9 @@ from web3 import Web3
 
 from ...config import ConfigManager
 from ...core.storage.postgres import PostgresStorage
+from .. import liquidity_filter as liquidity_filter_module
 from ..liquidity_filter import (
+    DISCOVERED_PRICE_CACHE_TTL,
     WETH_ADDRESS,
     PoolLiquidityFilter,
     normalize_token_for_pricing,
@@ -223,6 +227,323 @@ class TestV4NativeETH:
         assert isinstance(filtered_pools, dict)
 
 
+class _FakeDiscoveryStatement:
+    """Evaluates DISCOVERY_POOLS_QUERY's WHERE clause over an in-memory pools list."""
+
+    def __init__(self, pools):
+        self.pools = pools
+        self.frontiers = []
+
+    async def fetch(self, v2_factories, v3_factories, v4_factories, unpriced, priced):
+        self.frontiers.append(set(priced))
+        versions = {
+            **{f: "v4" for f in v4_factories},
+            **{f: "v3" for f in v3_factories},
+            **{f: "v2" for f in v2_factories},
+        }
+        return [
+            {
+                "pool_address": address,
+                "token0": token0,
+                "token1": token1,
+                "version": versions[factory],
+            }
+            for address, token0, token1, factory in self.pools
+            if factory in versions
+            and (
+                (token0 in unpriced and token1 in priced)
+                or (token0 in priced and token1 in unpriced)
+            )
+        ]
+
+
+class _FakeStorage:
+    """Just enough of PostgresStorage for discover_prices_from_all_pools."""
+
+    def __init__(self, stmt):
+        self.pool = self
+        self.stmt = stmt
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield self
+
+    async def prepare(self, query):
+        return self.stmt
+
+
+class TestMultiHopPriceDiscovery:
+    """Test discover_prices_from_all_pools across protocols without RPC or DB."""
+
+    @pytest.mark.asyncio
+    async def test_prices_chain_across_v2_and_v3(self, monkeypatch):
+        """X (priced) -V2- A -V3- B -V2- C is priced hop by hop; D is unreachable."""
+        x, a, b, c, d, e = (f"0x{str(i) * 40}" for i in range(1, 7))
+        v2_factory, v3_factory = "0x" + "f2" * 20, "0x" + "f3" * 20
+        pools = [
+            ("0xpool_xa", x, a, v2_factory),
+            ("0xpool_ab", a, b, v3_factory),
+            ("0xpool_bc", b, c, v2_factory),
+            ("0xpool_de", d, e, v2_factory),
+        ]
+        v2_reserves = {
+            # 1 X : 2 A, so A = $2 / 2
+            "0xpool_xa": {"reserve0": 10**18, "reserve1": 2 * 10**18},
+            # 1 B : 4 C, so C = B / 4
+            "0xpool_bc": {"reserve0": 10**18, "reserve1": 4 * 10**18},
+            "0xpool_de": {"reserve0": 10**18, "reserve1": 10**18},
+        }
+        # sqrtPriceX96 = 2 * 2^96 means 1 A = 4 B, so B = A / 4
+        v3_states = {"0xpool_ab": {"sqrtPriceX96": 2 * 2**96}}
+        v2_calls, v3_calls, v4_calls = [], [], []
+
+        class FakeV2Batcher:
+            def __init__(self, *args, **kwargs):
+                pass
+
+            async def iter_reserves_chunked(self, pair_addresses):
+                v2_calls.append(list(pair_addresses))
+                for addr in pair_addresses:
+                    yield {addr: v2_reserves[addr]}
+
+        class FakeV3Batcher:
+            def __init__(self, *args, **kwargs):
+                pass
+
+            async def fetch_pools_chunked(self, pool_addresses):
+                v3_calls.append(list(pool_addresses))
+                return {addr: v3_states[addr] for addr in pool_addresses}
+
+        class FakeV4Batcher:
+            def __init__(self, *args, **kwargs):
+                pass
+
+            async def fetch_pools_chunked(self, pool_ids):
+                v4_calls.append(list(pool_ids))
+                return {}
+
+        monkeypatch.setattr(
+            liquidity_filter_module, "UniswapV2ReservesBatcher", FakeV2Batcher
+        )
+        monkeypatch.setattr(
+            liquidity_filter_module, "UniswapV3DataBatcher", FakeV3Batcher
+        )
+        monkeypatch.setattr(
+            liquidity_filter_module, "UniswapV4DataBatcher", FakeV4Batcher
+        )
+
+        stmt = _FakeDiscoveryStatement(pools)
+        filter_instance = PoolLiquidityFilter(web3=None, use_reth_db=False)
+        fetched_states = {}
+
+        prices = await filter_instance.discover_prices_from_all_pools(
+            storage=_FakeStorage(stmt),
+            all_tokens={x, a, b, c, d},
+            initial_prices={x: Decimal("2")},
+            token_decimals={token: 18 for token in (x, a, b, c, d, e)},
+            v2_factories=[v2_factory],
+            v3_factories=[v3_factory],
+            v4_factories=[],
+            fetched_states=fetched_states,
+        )
+
+        assert float(prices[a]) == pytest.approx(1.0)
+        assert float(prices[b]) == pytest.approx(0.25)
+        assert float(prices[c]) == pytest.approx(0.0625)
+        assert d not in prices and e not in prices
+
+        # One round per hop, each querying only the tokens priced in the round
+        # before; the round whose frontier ({C}) reaches no new pools ends it
+        assert stmt.frontiers == [{x}, {a}, {b}, {c}]
+        assert v2_calls == [["0xpool_xa"], [], ["0xpool_bc"]]
+        assert v3_calls == [[], ["0xpool_ab"], []]
+        assert v4_calls == [[], [], []]
+        assert set(fetched_states["v2"]) == {"0xpool_xa", "0xpool_bc"}
+        assert set(fetched_states["v3"]) == {"0xpool_ab"}
+
+
+class TestV3V4LiquidityFromState:
+    """Test V3/V4 TVL estimates from liquidity and sqrtPriceX96."""
+
+    USDC = "0xa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48"
+    WETH = "0xc02aaa39b223fe8d0a0e5c4f27ead9083c756cc2"
+    # USDC (token0, 6 decimals) at $1 and WETH (token1, 18 decimals) at $2500:
+    # raw WETH per raw USDC = 1e12 / 2500 = 4e8, so sqrtP = 20000
+    SQRT_PRICE_X96 = 20000 * 2**96
+    # x = L / sqrtP = 1e12 raw USDC ($1M), y = L * sqrtP = 4e20 raw WETH ($1M)
+    LIQUIDITY = 2 * 10**16
+
+    def _resolved(self, price0=1.0, price1=2500.0):
+        return (price0, price1, 6, 18)
+
+    def test_both_sides_priced(self):
+        """Each virtual reserve is valued at its own USD price and summed."""
+        filter_instance = PoolLiquidityFilter(web3=None, use_reth_db=False)
+        state = {
+            "liquidity": str(self.LIQUIDITY),
+            "sqrtPriceX96": self.SQRT_PRICE_X96,
+        }
+
+        tvl = filter_instance._calculate_v3_v4_liquidity_from_state(
+            state, self._resolved()
+        )
+
+        assert tvl == pytest.approx(2_000_000, rel=1e-12)
+
+    def test_one_side_priced_is_doubled(self):
+        """With one price, the priced side stands for half the TVL."""
+        filter_instance = PoolLiquidityFilter(web3=None, use_reth_db=False)
+        state = {"liquidity": self.LIQUIDITY, "sqrtPriceX96": self.SQRT_PRICE_X96}
+
+        only_usdc = filter_instance._calculate_v3_v4_liquidity_from_state(
+            state, self._resolved(price1=None)
+        )
+        only_weth = filter_instance._calculate_v3_v4_liquidity_from_state(
+            state, self._resolved(price0=None)
+        )
+
+        assert only_usdc == pytest.approx(2_000_000, rel=1e-12)
+        assert only_weth == pytest.approx(2_000_000, rel=1e-12)
+
+    def test_unusable_state_returns_none(self):
+        """Empty pools, zero prices and partial states give no estimate."""
+        filter_instance = PoolLiquidityFilter(web3=None, use_reth_db=False)
+        calc = filter_instance._calculate_v3_v4_liquidity_from_state
+
+        assert calc({"liquidity": "0", "sqrtPriceX96": 1}, self._resolved()) is None
+        assert calc({"liquidity": 1, "sqrtPriceX96": 0}, self._resolved()) is None
+        assert calc({"sqrtPriceX96": 1}, self._resolved()) is None
+        assert (
+            calc(
+                {"liquidity": 1, "sqrtPriceX96": 1},
+                self._resolved(price0=None, price1=None),
+            )
+            is None
+        )
+
+    @pytest.mark.asyncio
+    async def test_min_liquidity_boundary(self, monkeypatch, tmp_path):
+        """Pools just above the V3 threshold are kept, just below are dropped."""
+        filter_instance = PoolLiquidityFilter(
+            web3=None, min_liquidity_v3_usd=2_000_000, use_reth_db=False
+        )
+        # TVL scales linearly with L, so +/- 1e-6 of L moves TVL by +/- $2
+        liquidity_by_pool = {
+            "0x" + "01" * 20: self.LIQUIDITY + self.LIQUIDITY // 1_000_000,
+            "0x" + "02" * 20: self.LIQUIDITY - self.LIQUIDITY // 1_000_000,
+        }
+        above, below = liquidity_by_pool
+        pools = {
+            addr: {
+                "token0": {"address": self.USDC},
+                "token1": {"address": self.WETH},
+                "protocol": "v3",
+            }
+            for addr in liquidity_by_pool
+        }
+
+        async def no_exchange_prices():
+            return {}
+
+        async def fake_discovery(**kwargs):
+            # Discovery hands its fetched pool state on to the filter step
+            kwargs["fetched_states"]["v3"].update(
+                {
+                    addr: {"liquidity": str(liq), "sqrtPriceX96": self.SQRT_PRICE_X96}
+                    for addr, liq in liquidity_by_pool.items()
+                }
+            )
+            return {self.USDC: Decimal("1"), self.WETH: Decimal("2500")}
+
+        monkeypatch.setattr(liquidity_filter_module, "PRICE_CACHE_DIR", tmp_path)
+        monkeypatch.setattr(
+            filter_instance, "fetch_hyperliquid_prices", no_exchange_prices
+        )
+        monkeypatch.setattr(filter_instance, "fetch_binance_prices", no_exchange_prices)
+        monkeypatch.setattr(
+            filter_instance, "discover_prices_from_all_pools", fake_discovery
+        )
+
+        result = await filter_instance.filter_pools_with_price_discovery(
+            storage=None,
+            all_tokens={self.USDC, self.WETH},
+            token_symbols={},
+            token_decimals={self.USDC: 6, self.WETH: 18},
+            v2_factories=[],
+            v3_factories=[],
+            v4_factories=[],
+            pools=pools,
+        )
+
+        assert list(result["filtered_pools"]) == [above]
+        assert result["filtered_pools"][above]["liquidity_usd"] == pytest.approx(
+            2_000_002, rel=1e-12
+        )
+        assert below not in result["filtered_pools"]
+
+
+class TestDiscoveredPriceCache:
+    """Test the on-disk cache of pool-discovered prices."""
+
+    @pytest.mark.asyncio
+    async def test_cached_entry_is_not_refreshed_and_expires(
+        self, monkeypatch, tmp_path
+    ):
+        """A cache-seeded price keeps its discovery time, so it still expires."""
+        cached_token = "0x" + "aa" * 20
+        new_token = "0x" + "bb" * 20
+        clock = [1_000_000.0]
+        cached_ts = clock[0] - DISCOVERED_PRICE_CACHE_TTL + 5
+
+        monkeypatch.setattr(liquidity_filter_module, "PRICE_CACHE_DIR", tmp_path)
+        monkeypatch.setattr(liquidity_filter_module.time, "time", lambda: clock[0])
+
+        filter_instance = PoolLiquidityFilter(web3=None, use_reth_db=False)
+        cache_path = filter_instance._discovered_price_cache_path()
+        cache_path.write_text(
+            json.dumps({"prices": {cached_token: {"price": "1.5", "ts": cached_ts}}})
+        )
+
+        async def no_exchange_prices():
+            return {}
+
+        seeds = []
+
+        async def fake_discovery(**kwargs):
+            seeds.append(dict(kwargs["initial_prices"]))
+            return {**kwargs["initial_prices"], new_token: Decimal("3")}
+
+        monkeypatch.setattr(
+            filter_instance, "fetch_hyperliquid_prices", no_exchange_prices
+        )
+        monkeypatch.setattr(filter_instance, "fetch_binance_prices", no_exchange_prices)
+        monkeypatch.setattr(
+            filter_instance, "discover_prices_from_all_pools", fake_discovery
+        )
+
+        await filter_instance.filter_pools_with_price_discovery(
+            storage=None,
+            all_tokens={cached_token, new_token},
+            token_symbols={},
+            token_decimals={},
+            v2_factories=[],
+            v3_factories=[],
+            v4_factories=[],
+            pools={},
+        )
+
+        assert seeds == [{cached_token: Decimal("1.5")}]
+        saved = json.loads(cache_path.read_text())["prices"]
+        assert saved[cached_token] == {"price": "1.5", "ts": cached_ts}
+        assert saved[new_token] == {"price": "3", "ts": clock[0]}
+
+        # Past the cached entry's TTL only the price discovered this run remains
+        clock[0] += 10
+        assert filter_instance._load_discovered_price_cache() == {
+            new_token: (Decimal("3"), clock[0] - 10)
+        }
+
+
 @pytest.mark.integration
 class TestFullPipeline:
     """Integration test for full whitelist and filtering pipeline."""
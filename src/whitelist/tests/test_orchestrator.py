@@ -0,0 +1,196 @@
+"""
+Tests for WhitelistOrchestrator's pool query.
+
+Runs WHITELIST_POOLS_QUERY against a temporary network_1_dex_pools_cryo table
+(shadowing the real one for the session) and checks its V4 hooks filter keeps
+the same pools as the Python filter it replaced. Skipped when the configured
+Postgres is not reachable.
+"""
+
+import asyncio
+import json
+
+import asyncpg
+import pytest
+import pytest_asyncio
+
+from ...config import ConfigManager
+from ..orchestrator import WHITELIST_POOLS_QUERY
+
+ZERO = "0x0000000000000000000000000000000000000000"
+HOOKS = "0x5Cd525c621AFCa515Bf58631D4733fbA7B72Aae4"
+TOKEN_A = "0x" + "aa" * 20
+TOKEN_B = "0x" + "bb" * 20
+OUTSIDER = "0x" + "cc" * 20
+V2_FACTORY = "0x5c69bee701ef814a2b6a3edd4b1652cb9cc5aa6f"
+V3_FACTORY = "0x1f98431c8ad98523631ae4a59f267346ea31f984"
+V4_MANAGER = "0x000000000004444c5dc75cb358380d2e3de08a90"
+
+# (address, factory, additional_data as stored in the jsonb column)
+POOLS = [
+    ("0xv4_null_data", V4_MANAGER, None),
+    ("0xv4_empty_object", V4_MANAGER, {}),
+    ("0xv4_missing_hooks", V4_MANAGER, {"fee": 3000}),
+    ("0xv4_empty_hooks", V4_MANAGER, {"hooks_address": ""}),
+    ("0xv4_zero_hooks", V4_MANAGER, {"hooks_address": ZERO}),
+    ("0xv4_zero_hooks_upper", V4_MANAGER, {"hooks_address": "0X" + "0" * 40}),
+    ("0xv4_hooks", V4_MANAGER, {"hooks_address": HOOKS}),
+    ("0xv4_hooks_lower", V4_MANAGER, {"hooks_address": HOOKS.lower()}),
+    ("0xv4_not_an_object", V4_MANAGER, [HOOKS]),
+    ("0xv2_with_hooks", V2_FACTORY.upper(), {"hooks_address": HOOKS}),
+    ("0xv3_with_hooks", V3_FACTORY, {"hooks_address": HOOKS}),
+    ("0xunknown_factory", "0x" + "dd" * 20, None),
+]
+
+
+def _legacy_keeps_pool(factory: str, additional_data) -> bool:
+    """The per-row Python filter the SQL predicate replaced."""
+    factory = factory.lower()
+    if factory in (V2_FACTORY, V3_FACTORY):
+        return True
+    if factory != V4_MANAGER:
+        return False
+
+    if additional_data:
+        # Parse JSON if it's a string (asyncpg returns jsonb as string)
+        if isinstance(additional_data, str):
+            try:
+                additional_data = json.loads(additional_data)
+            except json.JSONDecodeError:
+                pass  # If parsing fails, skip the filter
+
+        if isinstance(additional_data, dict):
+            hooks_address = additional_data.get("hooks_address", "").lower()
+            if hooks_address and hooks_address != ZERO:
+                return False
+    return True
+
+
+@pytest_asyncio.fixture
+async def conn():
+    """Session with a temporary pools table, or skip if Postgres is down."""
+    db = ConfigManager().database
+    try:
+        connection = await asyncio.wait_for(
+            asyncpg.connect(
+                host=db.POSTGRES_HOST,
+                port=db.POSTGRES_PORT,
+                user=db.POSTGRES_USER,
+                password=db.POSTGRES_PASSWORD,
+                database=db.POSTGRES_DB,
+            ),
+            timeout=5,
+        )
+    except (OSError, TimeoutError, asyncpg.PostgresError) as e:
+        pytest.skip(f"Postgres not available: {e}")
+
+    await connection.execute(
+        """
+        CREATE TEMP TABLE network_1_dex_pools_cryo (
+            address TEXT,
+            factory TEXT,
+            asset0 TEXT,
+            asset1 TEXT,
+            fee INTEGER,
+            tick_spacing INTEGER,
+            additional_data JSONB
+        )
+        """
+    )
+    rows = [
+        (
+            address,
+            factory,
+            TOKEN_A.replace("aa", "AA"),  # stored checksummed
+            TOKEN_B,
+            3000,
+            60,
+            None if data is None else json.dumps(data),
+        )
+        for address, factory, data in POOLS
+    ]
+    # A pool outside the token set is dropped whatever its hooks
+    rows.append(("0xv4_outsider", V4_MANAGER, TOKEN_A, OUTSIDER, 3000, 60, None))
+    await connection.executemany(
+        "INSERT INTO network_1_dex_pools_cryo VALUES ($1, $2, $3, $4, $5, $6, $7)",
+        rows,
+    )
+    try:
+        yield connection
+    finally:
+        await connection.close()
+
+
+@pytest.mark.integration
+class TestWhitelistPoolsQuery:
+    """Compare the SQL hooks filter with the legacy Python filter."""
+
+    @pytest.mark.asyncio
+    async def test_hooks_filter_matches_legacy_filter(self, conn):
+        """Null, missing, empty and zero hooks are kept; real hooks are dropped."""
+        results = await conn.fetch(
+            WHITELIST_POOLS_QUERY,
+            [TOKEN_A, TOKEN_B, ZERO],
+            [V2_FACTORY],
+            [V3_FACTORY],
+            [V4_MANAGER],
+            ZERO,
+        )
+        sql_kept = {row["address"]: row["protocol"] for row in results}
+
+        legacy_rows = await conn.fetch(
+            "SELECT address, factory, additional_data FROM network_1_dex_pools_cryo"
+            " WHERE asset1 = $1",
+            TOKEN_B,
+        )
+        legacy_kept = {
+            row["address"]
+            for row in legacy_rows
+            if _legacy_keeps_pool(row["factory"], row["additional_data"])
+        }
+
+        assert set(sql_kept) == legacy_kept
+        assert set(sql_kept) == {
+            "0xv4_null_data",
+            "0xv4_empty_object",
+            "0xv4_missing_hooks",
+            "0xv4_empty_hooks",
+            "0xv4_zero_hooks",
+            "0xv4_zero_hooks_upper",
+            "0xv4_not_an_object",
+            "0xv2_with_hooks",
+            "0xv3_with_hooks",
+        }
+        assert sql_kept["0xv2_with_hooks"] == "v2"
+        assert sql_kept["0xv3_with_hooks"] == "v3"
+        assert sql_kept["0xv4_zero_hooks"] == "v4"
+
+    @pytest.mark.asyncio
+    async def test_json_null_hooks_kept(self, conn):
+        """
+        A JSON null hooks_address counts as no hooks.
+
+        The legacy filter called .lower() on it and raised instead, so this
+        case is pinned separately rather than compared.
+        """
+        await conn.execute(
+            "INSERT INTO network_1_dex_pools_cryo VALUES"
+            " ('0xv4_null_hooks', $1, $2, $3, 3000, 60, $4)",
+            V4_MANAGER,
+            TOKEN_A,
+            TOKEN_B,
+            json.dumps({"hooks_address": None}),
+        )
+        with pytest.raises(AttributeError):
+            _legacy_keeps_pool(V4_MANAGER, json.dumps({"hooks_address": None}))
+
+        results = await conn.fetch(
+            WHITELIST_POOLS_QUERY,
+            [TOKEN_A, TOKEN_B],
+            [],
+            [],
+            [V4_MANAGER],
+            ZERO,
+        )
+
+        assert "0xv4_null_hooks" in {row["address"] for row in results}
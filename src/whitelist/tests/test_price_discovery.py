@@ -1,7 +1,7 @@
 """
 Test the price discovery methods in PoolLiquidityFilter.
 
-This demonstrates how to use the new V2, V3, and V4 price discovery methods.
+This demonstrates the combined V2/V3/V4 price discovery used by the filter.
 """
 
 import asyncio
@@ -170,70 +170,38 @@ async def main():
 
         logger.info(f"✅ Mapped {len(initial_prices)} exchange prices\n")
 
-        # Step 2: V2 Price Discovery
+        # Step 2: V2/V3/V4 Price Discovery (same path the filter uses)
         logger.info("=" * 80)
-        logger.info("STEP 2: V2 PRICE DISCOVERY")
+        logger.info("STEP 2: V2/V3/V4 PRICE DISCOVERY")
         logger.info("=" * 80)
 
         v2_factories = config.protocols.get_factory_addresses("uniswap_v2", "ethereum")
-
-        prices_after_v2 = await liquidity_filter.discover_prices_from_v2_pools(
-            storage=storage,
-            all_tokens=all_tokens,
-            initial_prices=initial_prices,
-            token_decimals=token_decimals,
-            v2_factories=v2_factories,
-            max_iterations=10,
-        )
-
-        logger.info(f"Total prices after V2: {len(prices_after_v2)}\n")
-
-        # Step 3: V3 Price Discovery
-        logger.info("=" * 80)
-        logger.info("STEP 3: V3 PRICE DISCOVERY")
-        logger.info("=" * 80)
-
         v3_factories = [
             "0x1F98431c8aD98523631AE4a59f267346ea31F984",  # Uniswap V3
             "0x0BFbCF9fa4f9C56B0F40a671Ad40E0805A091865",  # PancakeSwap V3
         ]
-
-        prices_after_v3 = await liquidity_filter.discover_prices_from_v3_pools(
-            storage=storage,
-            all_tokens=all_tokens,
-            initial_prices=prices_after_v2,
-            token_decimals=token_decimals,
-            v3_factories=v3_factories,
-            max_iterations=10,
-        )
-
-        logger.info(f"Total prices after V3: {len(prices_after_v3)}\n")
-
-        # Step 4: V4 Price Discovery
-        logger.info("=" * 80)
-        logger.info("STEP 4: V4 PRICE DISCOVERY")
-        logger.info("=" * 80)
-
         v4_factories = [
             "0x000000000004444c5dc75cb358380d2e3de08a90"  # V4 Pool Manager on Ethereum
         ]
 
-        prices_after_v4 = await liquidity_filter.discover_prices_from_v4_pools(
+        final_prices = await liquidity_filter.discover_prices_from_all_pools(
             storage=storage,
             all_tokens=all_tokens,
-            initial_prices=prices_after_v3,
+            initial_prices=initial_prices,
             token_decimals=token_decimals,
+            v2_factories=v2_factories,
+            v3_factories=v3_factories,
             v4_factories=v4_factories,
             max_iterations=10,
         )
 
-        logger.info(f"Total prices after V4: {len(prices_after_v4)}\n")
+        logger.info(f"Total prices after discovery: {len(final_prices)}\n")
 
         # Summary - calculate coverage for whitelisted tokens only
-        whitelisted_with_prices = set(prices_after_v4.keys()) & whitelisted_in_pools
+        whitelisted_with_prices = set(final_prices.keys()) & whitelisted_in_pools
 
         # Find extra tokens that got priced but weren't in original pool query
-        all_priced = set(prices_after_v4.keys())
+        all_priced = set(final_prices.keys())
         extra_tokens_discovered = all_priced - all_tokens_in_pools
 
         logger.info("=" * 80)
@@ -249,13 +217,7 @@ async def main():
         logger.info(f"")
         logger.info(f"Exchange prices: {len(initial_prices)}")
         logger.info(
-            f"After V2: {len(prices_after_v2)} (+{len(prices_after_v2) - len(initial_prices)})"
-        )
-        logger.info(
-            f"After V3: {len(prices_after_v3)} (+{len(prices_after_v3) - len(prices_after_v2)})"
-        )
-        logger.info(
-            f"After V4: {len(prices_after_v4)} (+{len(prices_after_v4) - len(prices_after_v3)})"
+            f"After discovery: {len(final_prices)} (+{len(final_prices) - len(initial_prices)})"
         )
         logger.info(f"")
         logger.info(
@@ -13,6 +13,8 @@ Key concepts:
   - ±200 ticks = 2% price movement
 """
 
+from functools import lru_cache
+
 # Q96 constants
 Q96 = 2**96
 
@@ -76,6 +78,8 @@ def get_amount1_delta(
     return (liquidity * (sqrt_ratio_b_x96 - sqrt_ratio_a_x96)) // Q96
 
 
+# Pure int -> int; pools on popular pairs share ticks, so memoize the bignum math
+@lru_cache(maxsize=1 << 16)
 def get_sqrt_ratio_at_tick(tick: int) -> int:
     """
     Calculate sqrtPriceX96 from tick.